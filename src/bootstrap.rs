@@ -5,11 +5,15 @@
 
 use std::collections::BTreeMap;
 use std::fs;
+use std::sync::LazyLock;
 
 use crate::db::HcomDb;
 use crate::identity::get_full_name;
 use crate::paths;
-use crate::shared::constants::{SENDER, ST_ACTIVE, ST_LISTENING};
+use crate::shared::constants::SENDER;
+
+static RE_HCOM_WORD: LazyLock<regex::Regex> =
+    LazyLock::new(|| regex::Regex::new(r"\bhcom\b").unwrap());
 
 // Bundled script names (compile-time known).
 // User scripts are discovered at runtime from ~/.hcom/scripts/.
@@ -223,39 +227,25 @@ Rules:
 /// Get concise list of active instances grouped by tool.
 /// Returns empty string if no active instances, or "\nActive (snapshot): claude: a, b | codex: c".
 fn get_active_instances(db: &HcomDb, exclude_name: &str) -> String {
-    let instances = match db.iter_instances_full() {
+    let cutoff = crate::shared::time::now_epoch_f64() - 60.0;
+    let instances = match db.iter_live_instances_full(exclude_name, cutoff, 8) {
         Ok(v) => v,
         Err(_) => return String::new(),
     };
 
-    let now = crate::shared::time::now_epoch_f64();
-    let cutoff = now - 60.0;
-
     // Collect names grouped by tool, preserving insertion order via BTreeMap
     let mut by_tool: BTreeMap<String, Vec<String>> = BTreeMap::new();
-    let mut count = 0;
 
     for inst in &instances {
-        if count >= 8 {
-            break;
-        }
-        if inst.name == exclude_name {
-            continue;
-        }
-
-        let status_time = inst.status_time as f64;
-        if inst.status == ST_ACTIVE || inst.status == ST_LISTENING || status_time >= cutoff {
-            let tool = if inst.tool.is_empty() {
-                "claude"
-            } else {
-                &inst.tool
-            };
-            by_tool
-                .entry(tool.to_string())
-                .or_default()
-                .push(get_full_name(inst));
-            count += 1;
-        }
+        let tool = if inst.tool.is_empty() {
+            "claude"
+        } else {
+            &inst.tool
+        };
+        by_tool
+            .entry(tool.to_string())
+            .or_default()
+            .push(get_full_name(inst));
     }
 
     if by_tool.is_empty() {
@@ -392,25 +382,55 @@ fn build_context(
     }
 }
 
-/// Apply string substitutions on template text.
-/// Replaces {key} patterns with context values, then unescapes {{ → { and }} → }
-/// then unescapes {{ → { and }} → } (template uses {{name}} to produce literal {name}).
+/// Write the context value for template placeholder `key` into `out`.
+/// Returns false for names that aren't placeholders (left as literal text).
+fn push_template_value(out: &mut String, key: &str, ctx: &BootstrapContext) -> bool {
+    match key {
+        "display_name" => out.push_str(&ctx.display_name),
+        "instance_name" => out.push_str(&ctx.instance_name),
+        "SENDER" => out.push_str(SENDER),
+        "tag" => out.push_str(&ctx.tag),
+        "hcom_cmd" => out.push_str(&ctx.hcom_cmd),
+        "active_instances" => out.push_str(&ctx.active_instances),
+        "scripts" => out.push_str(&ctx.scripts),
+        "launch_tools" => out.push_str(&ctx.launch_tools),
+        "target_name_s" => out.push_str(&recipient_token("name(s)")),
+        "target_luna" => out.push_str(&recipient_token("luna")),
+        "target_nova" => out.push_str(&recipient_token("nova")),
+        "target_tag" => out.push_str(&recipient_token(&format!("{}-", ctx.tag))),
+        _ => return false,
+    }
+    true
+}
+
+/// Apply string substitutions on template text in a single pass.
+/// Replaces {key} patterns with context values and unescapes {{ → { and }} → }
+/// (template uses {{name}} to produce literal {name}). An escape always wins,
+/// so `{{tag}}` renders as the literal `{tag}` even for a known key.
+/// Substituted values are copied verbatim: never rescanned or unescaped.
 fn render_template(template: &str, ctx: &BootstrapContext) -> String {
-    template
-        .replace("{display_name}", &ctx.display_name)
-        .replace("{instance_name}", &ctx.instance_name)
-        .replace("{SENDER}", SENDER)
-        .replace("{tag}", &ctx.tag)
-        .replace("{hcom_cmd}", &ctx.hcom_cmd)
-        .replace("{active_instances}", &ctx.active_instances)
-        .replace("{scripts}", &ctx.scripts)
-        .replace("{launch_tools}", &ctx.launch_tools)
-        .replace("{target_name_s}", &recipient_token("name(s)"))
-        .replace("{target_luna}", &recipient_token("luna"))
-        .replace("{target_nova}", &recipient_token("nova"))
-        .replace("{target_tag}", &recipient_token(&format!("{}-", ctx.tag)))
-        .replace("{{", "{")
-        .replace("}}", "}")
+    let mut out = String::with_capacity(template.len() + 512);
+    let mut rest = template;
+    while let Some(i) = rest.find(['{', '}']) {
+        out.push_str(&rest[..i]);
+        let tail = &rest[i..];
+        if tail.starts_with("{{") || tail.starts_with("}}") {
+            out.push_str(&tail[..1]);
+            rest = &tail[2..];
+            continue;
+        }
+        if tail.starts_with('{')
+            && let Some(end) = tail.find('}')
+            && push_template_value(&mut out, &tail[1..end], ctx)
+        {
+            rest = &tail[end + 1..];
+            continue;
+        }
+        out.push_str(&tail[..1]);
+        rest = &tail[1..];
+    }
+    out.push_str(rest);
+    out
 }
 
 // PUBLIC API
@@ -525,10 +545,7 @@ pub fn get_bootstrap(
             .replace("[hcom:", marker_sentinel)
             .replace("<hcom>", open_tag_sentinel)
             .replace("</hcom>", close_tag_sentinel);
-        result = regex::Regex::new(r"\bhcom\b")
-            .unwrap()
-            .replace_all(&result, &ctx.hcom_cmd)
-            .to_string();
+        result = RE_HCOM_WORD.replace_all(&result, &ctx.hcom_cmd).to_string();
         result = result
             .replace(command_sentinel, &ctx.hcom_cmd)
             .replace(marker_sentinel, "[hcom:")
@@ -663,6 +680,17 @@ mod tests {
         assert!(result.contains("kira"));
     }
 
+    #[test]
+    fn test_get_active_instances_caps_at_eight() {
+        let (_tmp, db) = setup_test_db();
+        for i in 0..10 {
+            insert_instance(&db, &format!("agent{i}"), "active", "claude", None);
+        }
+
+        let result = get_active_instances(&db, "other");
+        assert_eq!(result.matches("agent").count(), 8);
+    }
+
     #[test]
     fn test_get_bootstrap_claude() {
         let (tmp, db) = setup_test_db();
@@ -882,6 +910,22 @@ mod tests {
 
         let result = render_template("Name: {display_name}, Instance: {instance_name}", &ctx);
         assert_eq!(result, "Name: p0c-luna, Instance: luna");
+
+        // Escapes and unknown names stay literal; values are not rescanned.
+        let ctx = BootstrapContext {
+            scripts: "{tag} }}".to_string(),
+            ..ctx
+        };
+        let result = render_template("{{name}} {unknown} {tag} {scripts} {", &ctx);
+        assert_eq!(result, "{name} {unknown} p0c {tag} }} {");
+
+        // Escaped known keys stay literal; braces inside values keep their doubling.
+        let ctx = BootstrapContext {
+            active_instances: "{{x}}".to_string(),
+            ..ctx
+        };
+        let result = render_template("{{tag}} {{display_name}} {active_instances}", &ctx);
+        assert_eq!(result, "{tag} {display_name} {{x}}");
     }
 
     #[test]
@@ -82,7 +82,7 @@ pub fn check_identity_gate(
     cmd: &str,
     ctx: &CommandContext,
     has_from_flag: bool,
-    is_inside_ai_tool: bool,
+    is_inside_ai_tool: impl FnOnce() -> bool,
 ) -> Result<(), String> {
     if !identity::requires_identity(cmd) {
         return Ok(());
@@ -107,7 +107,7 @@ pub fn check_identity_gate(
         let mut msg = format!(
             "hcom identity not found, you need to run '{hcom_cmd} start' first, then use '{hcom_cmd} {cmd}'"
         );
-        if is_inside_ai_tool {
+        if is_inside_ai_tool() {
             msg.push_str(&format!(
                 "\nUsage:\n  {hcom_cmd} start              # New hcom identity (assigns new name)\n  {hcom_cmd} start --as <name>  # Rebind to existing identity\n  Then use the command: {hcom_cmd} {cmd} --name <name>"
             ));
@@ -635,7 +635,7 @@ mod tests {
             identity: None,
             go: false,
         };
-        assert!(check_identity_gate("list", &ctx, false, false).is_ok());
+        assert!(check_identity_gate("list", &ctx, false, || false).is_ok());
     }
 
     #[test]
@@ -645,7 +645,7 @@ mod tests {
             identity: None,
             go: false,
         };
-        assert!(check_identity_gate("send", &ctx, false, false).is_ok());
+        assert!(check_identity_gate("send", &ctx, false, || false).is_ok());
     }
 
     #[test]
@@ -655,7 +655,7 @@ mod tests {
             identity: None,
             go: false,
         };
-        assert!(check_identity_gate("send", &ctx, true, false).is_ok());
+        assert!(check_identity_gate("send", &ctx, true, || false).is_ok());
     }
 
     #[test]
@@ -665,7 +665,7 @@ mod tests {
             identity: None,
             go: false,
         };
-        let err = check_identity_gate("send", &ctx, false, false).unwrap_err();
+        let err = check_identity_gate("send", &ctx, false, || false).unwrap_err();
         assert!(err.contains("identity not found"));
     }
 
@@ -681,7 +681,7 @@ mod tests {
             }),
             go: false,
         };
-        assert!(check_identity_gate("send", &ctx, false, false).is_ok());
+        assert!(check_identity_gate("send", &ctx, false, || false).is_ok());
     }
 
     #[test]
@@ -691,7 +691,7 @@ mod tests {
             identity: None,
             go: false,
         };
-        let err = check_identity_gate("listen", &ctx, false, true).unwrap_err();
+        let err = check_identity_gate("listen", &ctx, false, || true).unwrap_err();
         assert!(err.contains("start --as"));
     }
 
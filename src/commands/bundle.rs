@@ -3,6 +3,7 @@
 //!
 //! Subcommands: list, show, cat, chain, prepare/preview, create.
 
+use std::fmt::Write as _;
 use std::path::Path;
 use std::time::SystemTime;
 
@@ -11,6 +12,7 @@ use serde_json::{Value, json};
 use crate::core::bundles;
 use crate::core::filters::FILE_WRITE_CONTEXTS;
 use crate::db::HcomDb;
+use crate::shared::time::format_age;
 use crate::shared::{CommandContext, SenderKind};
 
 // Re-use transcript parsing for bundle prepare/cat (C5 fix)
@@ -175,69 +177,132 @@ pub struct BundleCreateArgs {
 
 // ── Bundle Lookup ────────────────────────────────────────────────────────
 
+const SQL_BUNDLE_BY_EVENT_ID: &str =
+    "SELECT id, timestamp, data FROM events WHERE id = ? AND type = 'bundle'";
+/// Newest bundle whose bundle_id starts with a prefix, as the half-open range
+/// `[?1, ?2)` so idx_events_bundle_id can serve it (LIKE can't use an
+/// expression index).
+const SQL_BUNDLE_BY_PREFIX: &str = "SELECT id, timestamp, data FROM events WHERE type = 'bundle' AND json_extract(data, '$.bundle_id') >= ?1 AND json_extract(data, '$.bundle_id') < ?2 ORDER BY id DESC LIMIT 1";
+
+/// Follow `extends` links that name a full bundle_id, starting from `?1`, in
+/// one recursive query. Each level takes the newest event for that bundle_id
+/// (matching `get_bundle_by_id`); `path` stops the walk on cycles.
+const SQL_BUNDLE_ANCESTORS: &str = "WITH RECURSIVE chain(depth, id, ts, data, ext, path) AS (
+    SELECT 0, NULL, NULL, NULL, ?1, ','
+    UNION ALL
+    SELECT c.depth + 1, e.id, e.timestamp, e.data,
+           json_extract(e.data, '$.extends'), c.path || e.id || ','
+    FROM chain c
+    JOIN events e ON e.id = (SELECT MAX(id) FROM events
+                             WHERE type = 'bundle'
+                               AND json_extract(data, '$.bundle_id') = c.ext)
+    WHERE c.depth < 1000 AND instr(c.path, ',' || e.id || ',') = 0
+)
+SELECT id, ts, data FROM chain WHERE depth > 0 ORDER BY depth";
+
+/// Parse a bundle event row (`id, timestamp, data`), injecting `event_id` and
+/// `timestamp`. `data` is parsed straight from the row's borrowed text, so no
+/// intermediate String is allocated for the payload.
+fn bundle_from_row(row: &rusqlite::Row) -> rusqlite::Result<Option<Value>> {
+    let id: i64 = row.get(0)?;
+    let ts: String = row.get(1)?;
+    let Ok(mut data) = serde_json::from_str::<Value>(row.get_ref(2)?.as_str().unwrap_or_default())
+    else {
+        return Ok(None);
+    };
+    if let Some(obj) = data.as_object_mut() {
+        obj.insert("event_id".into(), json!(id));
+        obj.insert("timestamp".into(), json!(ts));
+    }
+    Ok(Some(data))
+}
+
+/// Ancestors reachable from `extends` through exact bundle_id links, nearest
+/// first. Empty when `extends` is a prefix or event ID (or the query fails);
+/// callers fall back to `get_bundle_by_id` for those hops.
+fn get_exact_ancestors(db: &HcomDb, extends: &str) -> Vec<Value> {
+    let Ok(mut stmt) = db.conn().prepare_cached(SQL_BUNDLE_ANCESTORS) else {
+        return Vec::new();
+    };
+    stmt.query_map(rusqlite::params![extends], bundle_from_row)
+        .map(|rows| rows.map_while(|r| r.ok().flatten()).collect())
+        .unwrap_or_default()
+}
+
+/// Run a single-bundle lookup statement through the prepared-statement cache.
+fn query_bundle(db: &HcomDb, sql: &str, params: impl rusqlite::Params) -> Option<Value> {
+    db.conn()
+        .prepare_cached(sql)
+        .ok()?
+        .query_row(params, bundle_from_row)
+        .ok()
+        .flatten()
+}
+
 /// Find a bundle by ID (event ID or bundle_id prefix).
 /// Returns bundle data with `event_id` and `timestamp` injected.
+///
+/// Statements go through the connection's prepared-statement cache, since
+/// `bundle chain` calls this once per ancestor.
 fn get_bundle_by_id(db: &HcomDb, id_or_prefix: &str) -> Option<Value> {
     // Try numeric event ID first
     if let Ok(event_id) = id_or_prefix.parse::<i64>()
-        && let Ok(row) = db.conn().query_row(
-            "SELECT id, timestamp, data FROM events WHERE id = ? AND type = 'bundle'",
-            rusqlite::params![event_id],
-            |row| {
-                let id: i64 = row.get(0)?;
-                let ts: String = row.get(1)?;
-                let data_str: String = row.get(2)?;
-                Ok((id, ts, data_str))
-            },
-        )
-        && let Ok(mut data) = serde_json::from_str::<Value>(&row.2)
+        && let Some(data) = query_bundle(db, SQL_BUNDLE_BY_EVENT_ID, [event_id])
     {
-        if let Some(obj) = data.as_object_mut() {
-            obj.insert("event_id".into(), json!(row.0));
-            obj.insert("timestamp".into(), json!(row.1));
-        }
         return Some(data);
     }
 
-    // Try bundle_id prefix match
     let bundle_id = if id_or_prefix.starts_with("bundle:") {
         id_or_prefix.to_string()
     } else {
         format!("bundle:{id_or_prefix}")
     };
 
-    let query = "SELECT id, timestamp, data FROM events WHERE type = 'bundle' AND json_extract(data, '$.bundle_id') LIKE ? ORDER BY id DESC LIMIT 1";
-    let pattern = format!("{bundle_id}%");
+    // Newest prefix match; an exact bundle_id is just the shortest prefix
+    let upper = prefix_upper_bound(&bundle_id)?;
+    query_bundle(db, SQL_BUNDLE_BY_PREFIX, [&bundle_id, &upper])
+}
 
-    db.conn()
-        .query_row(query, rusqlite::params![pattern], |row| {
-            let id: i64 = row.get(0)?;
-            let ts: String = row.get(1)?;
-            let data_str: String = row.get(2)?;
-            Ok((id, ts, data_str))
-        })
-        .ok()
-        .and_then(|(id, ts, data_str)| {
-            serde_json::from_str::<Value>(&data_str)
-                .ok()
-                .map(|mut data| {
-                    if let Some(obj) = data.as_object_mut() {
-                        obj.insert("event_id".into(), json!(id));
-                        obj.insert("timestamp".into(), json!(ts));
-                    }
-                    data
-                })
-        })
+/// Exclusive upper bound for a prefix range scan: the prefix with its last
+/// bumpable char incremented, so `[prefix, bound)` holds exactly the strings
+/// starting with `prefix` under SQLite's BINARY (code point) ordering.
+fn prefix_upper_bound(prefix: &str) -> Option<String> {
+    let mut head = prefix;
+    while let Some((i, c)) = head.char_indices().next_back() {
+        if let Some(next) = (c as u32 + 1..=char::MAX as u32).find_map(char::from_u32) {
+            return Some(format!("{}{next}", &head[..i]));
+        }
+        head = &head[..i];
+    }
+    None
 }
 
 // ── Subcommands ──────────────────────────────────────────────────────────
 
+/// Text value of a `json_extract` column, or None for NULL and non-text JSON
+/// values — the same result as a `Value::as_str()` lookup on the payload.
+fn column_text(row: &rusqlite::Row, i: usize) -> rusqlite::Result<Option<String>> {
+    Ok(row.get_ref(i)?.as_str().ok().map(str::to_string))
+}
+
 /// List bundles: `hcom bundle [list] [--last N] [--json]`
 fn cmd_bundle_list(db: &HcomDb, args: &BundleListArgs) -> i32 {
-    let json_mode = args.json;
     let last_n = args.last.unwrap_or(20);
+    if args.json {
+        return cmd_bundle_list_json(db, last_n);
+    }
 
-    let query = "SELECT id, timestamp, instance, data FROM events WHERE type = 'bundle' ORDER BY id DESC LIMIT ?";
+    // The table only needs three scalar fields, so let SQLite pull them out
+    // instead of deserializing every bundle payload (refs can be large).
+    // Rows with malformed data render with blank fields rather than failing
+    // the whole query.
+    let query = "SELECT unixepoch(timestamp),
+                json_extract(data, '$.bundle_id'),
+                json_extract(data, '$.title'),
+                json_extract(data, '$.created_by')
+         FROM (SELECT id, timestamp,
+                      CASE WHEN json_valid(data) THEN data ELSE '{}' END AS data
+               FROM events WHERE type = 'bundle' ORDER BY id DESC LIMIT ?)";
 
     let mut stmt = match db.conn().prepare(query) {
         Ok(s) => s,
@@ -247,13 +312,13 @@ fn cmd_bundle_list(db: &HcomDb, args: &BundleListArgs) -> i32 {
         }
     };
 
-    let rows: Vec<(i64, String, String, String)> = stmt
+    let rows: Vec<(Option<i64>, Option<String>, Option<String>, Option<String>)> = stmt
         .query_map(rusqlite::params![last_n as i64], |row| {
             Ok((
-                row.get::<_, i64>(0)?,
-                row.get::<_, String>(1)?,
-                row.get::<_, String>(2)?,
-                row.get::<_, String>(3)?,
+                row.get::<_, Option<i64>>(0)?,
+                column_text(row, 1)?,
+                column_text(row, 2)?,
+                column_text(row, 3)?,
             ))
         })
         .ok()
@@ -262,30 +327,6 @@ fn cmd_bundle_list(db: &HcomDb, args: &BundleListArgs) -> i32 {
         .filter_map(|r| r.ok())
         .collect();
 
-    // JSON mode outputs even when empty (prints "[]")
-    if json_mode {
-        let mut bundles: Vec<Value> = Vec::new();
-        for (id, ts, _inst, data_str) in &rows {
-            let data: Value = serde_json::from_str(data_str).unwrap_or(json!({}));
-            let events_val = data
-                .get("refs")
-                .and_then(|r| r.get("events"))
-                .cloned()
-                .unwrap_or(json!([]));
-            bundles.push(json!({
-                "id": id,
-                "timestamp": ts,
-                "bundle_id": data.get("bundle_id").and_then(|v| v.as_str()).unwrap_or(""),
-                "title": data.get("title").and_then(|v| v.as_str()).unwrap_or(""),
-                "description": data.get("description").and_then(|v| v.as_str()).unwrap_or(""),
-                "created_by": data.get("created_by").and_then(|v| v.as_str()).unwrap_or(""),
-                "events": events_val,
-            }));
-        }
-        println!("{}", serde_json::to_string(&bundles).unwrap_or_default());
-        return 0;
-    }
-
     if rows.is_empty() {
         println!("No bundles found. Create one with: hcom bundle prepare");
         return 0;
@@ -294,27 +335,17 @@ fn cmd_bundle_list(db: &HcomDb, args: &BundleListArgs) -> i32 {
     // Human-readable table
     let now_secs = crate::shared::time::now_epoch_i64();
 
-    println!("{:<12} {:<30} {:<12} AGE", "BUNDLE_ID", "TITLE", "BY");
-    for (_id, ts, _inst, data_str) in &rows {
-        let data: Value = serde_json::from_str(data_str).unwrap_or(json!({}));
-        let bundle_id = data.get("bundle_id").and_then(|v| v.as_str()).unwrap_or("");
-        let title = data
-            .get("title")
-            .and_then(|v| v.as_str())
-            .unwrap_or("(untitled)");
-        let created_by = data
-            .get("created_by")
-            .and_then(|v| v.as_str())
-            .unwrap_or("");
-
-        // Parse timestamp for age
-        let age = if let Ok(created) = chrono::DateTime::parse_from_rfc3339(ts)
-            .or_else(|_| chrono::DateTime::parse_from_str(ts, "%Y-%m-%d %H:%M:%S%.f%z"))
-        {
-            let age_secs = now_secs - created.timestamp();
-            format_age(age_secs)
-        } else {
-            "?".to_string()
+    // Render the whole table, then write it in one go
+    let mut out = format!("{:<12} {:<30} {:<12} AGE\n", "BUNDLE_ID", "TITLE", "BY");
+    for (created, bundle_id, title, created_by) in &rows {
+        let bundle_id = bundle_id.as_deref().unwrap_or("");
+        let title = title.as_deref().unwrap_or("(untitled)");
+        let created_by = created_by.as_deref().unwrap_or("");
+
+        // SQLite yields NULL for timestamps it cannot parse
+        let age = match created {
+            Some(created) => format_age(now_secs - created),
+            None => "?".to_string(),
         };
 
         // Truncate display
@@ -333,12 +364,66 @@ fn cmd_bundle_list(db: &HcomDb, args: &BundleListArgs) -> i32 {
             title.to_string()
         };
 
-        println!("{short_id:<12} {short_title:<30} {created_by:<12} {age}");
+        let _ = writeln!(
+            out,
+            "{short_id:<12} {short_title:<30} {created_by:<12} {age}"
+        );
     }
+    print!("{out}");
 
     0
 }
 
+/// `hcom bundle list --json`: full rows including event refs.
+fn cmd_bundle_list_json(db: &HcomDb, last_n: usize) -> i32 {
+    // Scalars come out of SQLite directly; only the events ref array is
+    // handed back as JSON text (`->`) and parsed, not the whole payload.
+    let query = "SELECT id, timestamp,
+                json_extract(data, '$.bundle_id'),
+                json_extract(data, '$.title'),
+                json_extract(data, '$.description'),
+                json_extract(data, '$.created_by'),
+                data -> '$.refs.events'
+         FROM (SELECT id, timestamp,
+                      CASE WHEN json_valid(data) THEN data ELSE '{}' END AS data
+               FROM events WHERE type = 'bundle' ORDER BY id DESC LIMIT ?)";
+
+    let mut stmt = match db.conn().prepare(query) {
+        Ok(s) => s,
+        Err(e) => {
+            eprintln!("Error: {e}");
+            return 1;
+        }
+    };
+
+    let text_or_empty = |v: Option<String>| v.unwrap_or_default();
+    let bundles: Vec<Value> = stmt
+        .query_map(rusqlite::params![last_n as i64], |row| {
+            let events = row
+                .get::<_, Option<String>>(6)?
+                .and_then(|raw| serde_json::from_str::<Value>(&raw).ok())
+                .unwrap_or(json!([]));
+            Ok(json!({
+                "id": row.get::<_, i64>(0)?,
+                "timestamp": row.get::<_, String>(1)?,
+                "bundle_id": text_or_empty(column_text(row, 2)?),
+                "title": text_or_empty(column_text(row, 3)?),
+                "description": text_or_empty(column_text(row, 4)?),
+                "created_by": text_or_empty(column_text(row, 5)?),
+                "events": events,
+            }))
+        })
+        .ok()
+        .into_iter()
+        .flatten()
+        .filter_map(|r| r.ok())
+        .collect();
+
+    // JSON mode outputs even when empty (prints "[]")
+    println!("{}", serde_json::to_string(&bundles).unwrap_or_default());
+    0
+}
+
 /// Show bundle: `hcom bundle show <id> [--json]`
 fn cmd_bundle_show(db: &HcomDb, args: &BundleShowArgs) -> i32 {
     let json_mode = args.json;
@@ -352,10 +437,7 @@ fn cmd_bundle_show(db: &HcomDb, args: &BundleShowArgs) -> i32 {
     };
 
     if json_mode {
-        println!(
-            "{}",
-            serde_json::to_string_pretty(&bundle).unwrap_or_default()
-        );
+        println!("{}", serde_json::to_string(&bundle).unwrap_or_default());
     } else {
         let title = bundle.get("title").and_then(|v| v.as_str()).unwrap_or("");
         let desc = bundle
@@ -684,11 +766,10 @@ fn cmd_bundle_chain(db: &HcomDb, args: &BundleChainArgs) -> i32 {
     let json_mode = args.json;
 
     let mut chain = Vec::new();
-    let mut current_id = args.id.clone();
     let mut seen = std::collections::HashSet::new();
 
     // First bundle must exist
-    let first = match get_bundle_by_id(db, &current_id) {
+    let first = match get_bundle_by_id(db, &args.id) {
         Some(b) => b,
         None => {
             eprintln!("Error: Bundle not found: {}", args.id);
@@ -696,54 +777,60 @@ fn cmd_bundle_chain(db: &HcomDb, args: &BundleChainArgs) -> i32 {
         }
     };
 
-    let bid = first
-        .get("bundle_id")
-        .and_then(|v| v.as_str())
-        .unwrap_or("")
-        .to_string();
-    seen.insert(bid.clone());
-    chain.push(first.clone());
-
-    // Walk up the chain
-    if let Some(parent_id) = first.get("extends").and_then(|v| v.as_str()) {
-        current_id = parent_id.to_string();
-        loop {
-            let bundle = match get_bundle_by_id(db, &current_id) {
-                Some(b) => b,
+    let bundle_id_of = |bundle: &Value| {
+        bundle
+            .get("bundle_id")
+            .and_then(|v| v.as_str())
+            .unwrap_or("")
+            .to_string()
+    };
+    let extends_of = |bundle: &Value| {
+        bundle
+            .get("extends")
+            .and_then(|v| v.as_str())
+            .map(str::to_string)
+    };
+
+    seen.insert(bundle_id_of(&first));
+    let mut next = extends_of(&first);
+    chain.push(first);
+
+    // Walk up the chain: full bundle_id links resolve in one recursive query;
+    // a prefix or event-ID link falls back to a single lookup, then the fast
+    // path resumes from that ancestor.
+    'walk: while let Some(parent_id) = next.take() {
+        // A full bundle_id already in the chain closes a cycle; stop without
+        // another lookup. Prefixes and event IDs still need resolving first.
+        if parent_id.starts_with("bundle:") && seen.contains(&parent_id) {
+            break;
+        }
+        let mut ancestors = get_exact_ancestors(db, &parent_id);
+        if ancestors.is_empty() {
+            match get_bundle_by_id(db, &parent_id) {
+                Some(b) => ancestors.push(b),
                 None => {
                     // Warn about missing ancestor
-                    eprintln!("Warning: missing ancestor bundle {current_id}");
+                    eprintln!("Warning: missing ancestor bundle {parent_id}");
                     break;
                 }
-            };
-
-            let bid = bundle
-                .get("bundle_id")
-                .and_then(|v| v.as_str())
-                .unwrap_or("")
-                .to_string();
-            if seen.contains(&bid) {
-                break; // Cycle detection
             }
-            seen.insert(bid.clone());
-            chain.push(bundle.clone());
+        }
 
-            match bundle.get("extends").and_then(|v| v.as_str()) {
-                Some(parent) => current_id = parent.to_string(),
-                None => break,
+        for bundle in ancestors {
+            if !seen.insert(bundle_id_of(&bundle)) {
+                break 'walk; // Cycle detection
             }
+            next = extends_of(&bundle);
+            chain.push(bundle);
         }
     }
 
     if json_mode {
-        println!(
-            "{}",
-            serde_json::to_string_pretty(&chain).unwrap_or_default()
-        );
+        println!("{}", serde_json::to_string(&chain).unwrap_or_default());
         return 0;
     }
 
-    println!("Bundle chain ({} levels):", chain.len());
+    let mut out = format!("Bundle chain ({} levels):\n", chain.len());
     for (i, bundle) in chain.iter().enumerate() {
         let bid = bundle
             .get("bundle_id")
@@ -755,8 +842,9 @@ fn cmd_bundle_chain(db: &HcomDb, args: &BundleChainArgs) -> i32 {
             .unwrap_or("(untitled)");
         let indent = "  ".repeat(i);
         let marker = if i == 0 { "→" } else { "↳" };
-        println!("{indent}{marker} {bid}: {title}");
+        let _ = writeln!(out, "{indent}{marker} {bid}: {title}");
     }
+    print!("{out}");
 
     0
 }
@@ -1104,12 +1192,19 @@ fn cmd_bundle_create(db: &HcomDb, args: &BundleCreateArgs, ctx: Option<&CommandC
         return 1;
     }
 
-    // Raw bundle mode
-    if let Some(raw) = args.bundle_json.as_ref().cloned().or_else(|| {
-        args.bundle_file
-            .as_ref()
-            .and_then(|path| std::fs::read_to_string(path).ok())
-    }) {
+    // Raw bundle mode (borrow --bundle; only --bundle-file needs an owned read)
+    let raw: Option<std::borrow::Cow<'_, str>> = match (&args.bundle_json, &args.bundle_file) {
+        (Some(raw), _) => Some(raw.as_str().into()),
+        (None, Some(path)) => match std::fs::read_to_string(path) {
+            Ok(raw) => Some(raw.into()),
+            Err(e) => {
+                eprintln!("Error: Cannot read --bundle-file {path}: {e}");
+                return 1;
+            }
+        },
+        (None, None) => None,
+    };
+    if let Some(raw) = raw {
         let mut bundle: Value = match serde_json::from_str(&raw) {
             Ok(v) => v,
             Err(e) => {
@@ -1308,8 +1403,6 @@ fn format_event_summary(data: &Value) -> String {
     "(no summary)".to_string()
 }
 
-use crate::shared::time::format_age;
-
 // ── Main Entry Point ─────────────────────────────────────────────────────
 
 /// Main entry point for `hcom bundle` command.
@@ -1317,15 +1410,11 @@ use crate::shared::time::format_age;
 pub fn cmd_bundle(db: &HcomDb, args: &BundleArgs, ctx: Option<&CommandContext>) -> i32 {
     let argv = &args.args;
     let subcmd = argv.first().map(|s| s.as_str()).unwrap_or("list");
-    let sub_argv: Vec<String> = if argv.is_empty() {
-        vec![]
-    } else {
-        argv[1..].to_vec()
-    };
+    let sub_argv: &[String] = argv.get(1..).unwrap_or_default();
 
     /// Try parsing a clap Args struct from sub-argv. Returns exit code on error.
     fn try_parse<T: clap::Parser>(name: &str, argv: &[String]) -> Result<T, i32> {
-        T::try_parse_from(std::iter::once(name.to_string()).chain(argv.iter().cloned())).map_err(
+        T::try_parse_from(std::iter::once(name).chain(argv.iter().map(String::as_str))).map_err(
             |e| {
                 e.print().ok();
                 if e.use_stderr() { 1 } else { 0 }
@@ -1334,29 +1423,27 @@ pub fn cmd_bundle(db: &HcomDb, args: &BundleArgs, ctx: Option<&CommandContext>)
     }
 
     match subcmd {
-        "list" => match try_parse::<BundleListArgs>("bundle list", &sub_argv) {
+        "list" => match try_parse::<BundleListArgs>("bundle list", sub_argv) {
             Ok(a) => cmd_bundle_list(db, &a),
             Err(code) => code,
         },
-        "show" => match try_parse::<BundleShowArgs>("bundle show", &sub_argv) {
+        "show" => match try_parse::<BundleShowArgs>("bundle show", sub_argv) {
             Ok(a) => cmd_bundle_show(db, &a),
             Err(code) => code,
         },
-        "cat" => match try_parse::<BundleCatArgs>("bundle cat", &sub_argv) {
+        "cat" => match try_parse::<BundleCatArgs>("bundle cat", sub_argv) {
             Ok(a) => cmd_bundle_cat(db, &a),
             Err(code) => code,
         },
-        "chain" => match try_parse::<BundleChainArgs>("bundle chain", &sub_argv) {
+        "chain" => match try_parse::<BundleChainArgs>("bundle chain", sub_argv) {
             Ok(a) => cmd_bundle_chain(db, &a),
             Err(code) => code,
         },
-        "prepare" | "preview" => {
-            match try_parse::<BundlePrepareArgs>("bundle prepare", &sub_argv) {
-                Ok(a) => cmd_bundle_prepare(db, &a, ctx),
-                Err(code) => code,
-            }
-        }
-        "create" => match try_parse::<BundleCreateArgs>("bundle create", &sub_argv) {
+        "prepare" | "preview" => match try_parse::<BundlePrepareArgs>("bundle prepare", sub_argv) {
+            Ok(a) => cmd_bundle_prepare(db, &a, ctx),
+            Err(code) => code,
+        },
+        "create" => match try_parse::<BundleCreateArgs>("bundle create", sub_argv) {
             Ok(a) => cmd_bundle_create(db, &a, ctx),
             Err(code) => code,
         },
@@ -1580,4 +1667,75 @@ mod tests {
             None
         );
     }
+
+    #[test]
+    fn test_prefix_upper_bound() {
+        assert_eq!(
+            prefix_upper_bound("bundle:ab").as_deref(),
+            Some("bundle:ac")
+        );
+        assert_eq!(
+            prefix_upper_bound("bundle:a\u{10FFFF}").as_deref(),
+            Some("bundle:b")
+        );
+        assert_eq!(prefix_upper_bound(""), None);
+    }
+
+    #[test]
+    fn test_get_bundle_by_id_prefers_newest_prefix_match() {
+        let db = test_db();
+        for id in ["bundle:ab", "bundle:abc123", "bundle:b"] {
+            db.log_event("bundle", "luna", &json!({"bundle_id": id, "title": id}))
+                .unwrap();
+        }
+        let found = |query: &str| {
+            get_bundle_by_id(&db, query).map(|b| b["bundle_id"].as_str().unwrap().to_string())
+        };
+        // A newer bundle:abc123 wins over the older exact bundle:ab
+        assert_eq!(found("ab").as_deref(), Some("bundle:abc123"));
+        assert_eq!(found("bundle:abc").as_deref(), Some("bundle:abc123"));
+        assert_eq!(found("b").as_deref(), Some("bundle:b"));
+        // No wildcard expansion: `_` is a literal char
+        assert_eq!(found("a_"), None);
+        assert_eq!(found("zz"), None);
+    }
+
+    #[test]
+    fn test_get_exact_ancestors_follows_full_ids_and_stops_on_cycle() {
+        let db = test_db();
+        let log = |id: &str, extends: Option<&str>| {
+            let mut data = json!({"bundle_id": id, "title": id});
+            if let Some(ext) = extends {
+                data["extends"] = json!(ext);
+            }
+            db.log_event("bundle", "luna", &data).unwrap();
+        };
+        log("bundle:aaa", None);
+        log("bundle:bbb", Some("bundle:aaa"));
+        log("bundle:ccc", Some("bundle:bbb"));
+        // Prefix links are left to get_bundle_by_id
+        log("bundle:ddd", Some("ccc"));
+        // Cycle: eee -> fff -> eee
+        log("bundle:eee", Some("bundle:fff"));
+        log("bundle:fff", Some("bundle:eee"));
+
+        let ids = |bundles: Vec<Value>| -> Vec<String> {
+            bundles
+                .iter()
+                .map(|b| b["bundle_id"].as_str().unwrap().to_string())
+                .collect()
+        };
+        assert_eq!(
+            ids(get_exact_ancestors(&db, "bundle:ccc")),
+            vec!["bundle:ccc", "bundle:bbb", "bundle:aaa"]
+        );
+        assert!(get_exact_ancestors(&db, "ccc").is_empty());
+        assert_eq!(
+            ids(get_exact_ancestors(&db, "bundle:eee")),
+            vec!["bundle:eee", "bundle:fff"]
+        );
+        let first = &get_exact_ancestors(&db, "bundle:aaa")[0];
+        assert!(first.get("event_id").is_some());
+        assert!(first.get("timestamp").is_some());
+    }
 }
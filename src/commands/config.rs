@@ -409,15 +409,31 @@ pub fn config_get(key: &str) -> (String, &'static str) {
     if let Ok(val) = std::env::var(key) {
         return (val, "env");
     }
+    config_get_toml_or_default(key, load_config_table().as_ref())
+}
+
+/// `config_get` against an already-parsed config.toml, for callers that read
+/// many keys (e.g. `hcom config`) and shouldn't re-read the file per key.
+fn config_get_from(key: &str, table: Option<&toml::Table>) -> (String, &'static str) {
+    if let Ok(val) = std::env::var(key) {
+        return (val, "env");
+    }
+    config_get_toml_or_default(key, table)
+}
+
+/// Parse config.toml, or None if it is missing or malformed.
+fn load_config_table() -> Option<toml::Table> {
+    load_config_content().parse::<toml::Table>().ok()
+}
 
+fn config_get_toml_or_default(key: &str, table: Option<&toml::Table>) -> (String, &'static str) {
     // Map to field name and nested TOML path
     let field_name = key.strip_prefix("HCOM_").unwrap_or(key).to_lowercase();
 
-    let content = load_config_content();
-    if let Ok(table) = content.parse::<toml::Table>() {
+    if let Some(table) = table {
         // Try nested path first
         if let Some(dotted_path) = toml_path_for_key(&field_name)
-            && let Some(val) = get_nested_toml(&table, dotted_path)
+            && let Some(val) = get_nested_toml(table, dotted_path)
         {
             let val_str = match &val {
                 toml::Value::String(s) => s.clone(),
@@ -536,6 +552,13 @@ fn config_dev_root(
 
 // ── Instance Config ──────────────────────────────────────────────────────
 
+/// Per-instance tags: empty (clears the tag) or alphanumeric with hyphens and
+/// underscores. A single char scan; a regex would only add compile cost here.
+fn is_valid_instance_tag(tag: &str) -> bool {
+    tag.chars()
+        .all(|c| c.is_alphanumeric() || c == '-' || c == '_')
+}
+
 /// Handle instance-level config: `hcom config -i <name> [key] [value]`
 fn config_instance(
     db: &HcomDb,
@@ -648,11 +671,7 @@ fn config_instance(
         "tag" => {
             let tag = if value.is_empty() { "" } else { value };
             // Validate: alphanumeric, hyphens, underscores only
-            if !tag.is_empty()
-                && !tag
-                    .chars()
-                    .all(|c| c.is_alphanumeric() || c == '-' || c == '_')
-            {
+            if !is_valid_instance_tag(tag) {
                 eprintln!("Error: Tag must be alphanumeric (hyphens and underscores allowed)");
                 return 1;
             }
@@ -898,11 +917,7 @@ pub fn config_instance_set(
 
     match key {
         "tag" => {
-            if !value.is_empty()
-                && !value
-                    .chars()
-                    .all(|c| c.is_alphanumeric() || c == '-' || c == '_')
-            {
+            if !is_valid_instance_tag(value) {
                 return Err("Tag must be alphanumeric (hyphens and underscores allowed)".into());
             }
             db.conn()
@@ -976,7 +991,7 @@ pub fn cmd_config(db: &HcomDb, args: &ConfigArgs, ctx: Option<&CommandContext>)
     let reset_mode = args.reset;
     let info_mode = args.info;
     let setup_mode = args.setup;
-    let instance_name = args.instance.clone();
+    let instance_name = args.instance.as_deref();
     // Reconstruct argv from key + value for backward compat with existing handlers
     let argv: Vec<String> = args
         .key
@@ -987,10 +1002,9 @@ pub fn cmd_config(db: &HcomDb, args: &ConfigArgs, ctx: Option<&CommandContext>)
 
     // --setup: only valid with 'terminal kitty' (C4 fix)
     if setup_mode {
-        let positional: Vec<&String> = argv.iter().filter(|a| !a.starts_with('-')).collect();
-        let is_kitty_terminal = positional.len() >= 2
-            && positional[0] == "terminal"
-            && positional[1].starts_with("kitty");
+        let mut positional = argv.iter().filter(|a| !a.starts_with('-'));
+        let is_kitty_terminal = positional.next().is_some_and(|a| a == "terminal")
+            && positional.next().is_some_and(|a| a.starts_with("kitty"));
         if !is_kitty_terminal {
             eprintln!(
                 "Error: --setup is only valid with kitty: hcom config terminal kitty --setup"
@@ -1000,7 +1014,7 @@ pub fn cmd_config(db: &HcomDb, args: &ConfigArgs, ctx: Option<&CommandContext>)
     }
 
     // Instance config mode
-    if let Some(ref inst) = instance_name {
+    if let Some(inst) = instance_name {
         let resolved = identity::resolve_display_name(db, inst).unwrap_or_else(|| inst.to_string());
         if let Some((base_name, device)) = crate::relay::control::split_device_suffix(&resolved) {
             let action = if argv.len() >= 2 {
@@ -1189,6 +1203,7 @@ fn normalize_key(input: &str) -> String {
 fn get_runtime_overrides(
     db: &HcomDb,
     ctx: Option<&CommandContext>,
+    config_table: Option<&toml::Table>,
 ) -> std::collections::HashMap<&'static str, String> {
     use std::collections::HashMap;
 
@@ -1227,7 +1242,7 @@ fn get_runtime_overrides(
             _ => None,
         };
         if let Some(val) = val {
-            let (global_val, _) = config_get(config_key);
+            let (global_val, _) = config_get_from(config_key, config_table);
             if val != global_val {
                 overrides.insert(config_key, val);
             }
@@ -1237,18 +1252,37 @@ fn get_runtime_overrides(
     overrides
 }
 
+/// Leading (up to 4) characters of a relay token shown in masked config output.
+/// Cuts on a char boundary so a non-ASCII token can't panic the slice.
+fn relay_token_preview(value: &str) -> &str {
+    let end = value.char_indices().nth(4).map_or(value.len(), |(i, _)| i);
+    &value[..end]
+}
+
+/// JSON view of a relay token: masked only when longer than its preview, so a
+/// short token is shown as-is rather than as `<whole token>***`.
+fn relay_token_json_display(value: String) -> String {
+    let preview = relay_token_preview(&value);
+    if preview.len() < value.len() {
+        format!("{preview}***")
+    } else {
+        value
+    }
+}
+
 /// Show all config keys with values and sources.
 fn show_all_config(db: &HcomDb, ctx: Option<&CommandContext>, json_mode: bool) -> i32 {
-    let runtime_overrides = get_runtime_overrides(db, ctx);
+    // Parse config.toml once for every key shown below.
+    let config_table = load_config_table();
     let dev_root = crate::router::resolve_effective_dev_root(db.path());
 
     if json_mode {
         let mut result = serde_json::Map::new();
         for (key, _, _) in CONFIG_KEYS {
-            let (value, _source) = config_get(key);
+            let (value, _source) = config_get_from(key, config_table.as_ref());
             // {KEY: value} — mask relay token
-            let display = if *key == "HCOM_RELAY_TOKEN" && value.len() > 4 {
-                format!("{}***", &value[..4])
+            let display = if *key == "HCOM_RELAY_TOKEN" {
+                relay_token_json_display(value)
             } else {
                 value
             };
@@ -1269,6 +1303,8 @@ fn show_all_config(db: &HcomDb, ctx: Option<&CommandContext>, json_mode: bool) -
             serde_json::to_string_pretty(&Value::Object(result)).unwrap_or_default()
         );
     } else {
+        // Only the text view shows [runtime] overrides; skip the instance lookup for --json.
+        let runtime_overrides = get_runtime_overrides(db, ctx, config_table.as_ref());
         println!("hcom configuration ({})\n", config_path().display());
         println!("hcom Settings:");
         for (key, _desc, _) in CONFIG_KEYS {
@@ -1276,12 +1312,11 @@ fn show_all_config(db: &HcomDb, ctx: Option<&CommandContext>, json_mode: bool) -
             let (display, source) = if let Some(val) = runtime_overrides.get(key) {
                 (val.clone(), "runtime")
             } else {
-                let (value, source) = config_get(key);
+                let (value, source) = config_get_from(key, config_table.as_ref());
                 let display = if value.is_empty() {
                     "(not set)".to_string()
-                } else if *key == "HCOM_RELAY_TOKEN" && !value.is_empty() {
-                    let visible = value.len().min(4);
-                    format!("{}...", &value[..visible])
+                } else if *key == "HCOM_RELAY_TOKEN" {
+                    format!("{}...", relay_token_preview(&value))
                 } else {
                     value
                 };
@@ -1679,41 +1714,33 @@ pub fn terminal_help_text(show_current: bool) -> String {
         other => other,
     };
 
-    // Managed parents and their variants. A preset is "managed" when it
-    // defines `close` — hcom can shut its agent window down on kill. The
-    // built-in list is hand-curated here for ordering and human-readable
-    // descriptions, but `is_managed_preset` below is the source of truth for
-    // section bucketing so a new managed preset never gets mis-listed under
-    // "Other (opens window only)".
-    const MANAGED_PARENTS: &[(&str, &str)] = &[
-        ("kitty", "auto split/tab/window"),
-        ("wezterm", "auto tab/split/window"),
-        ("tmux", "detached sessions"),
-        ("cmux", "workspaces"),
-        ("zellij", "panes"),
-        ("waveterm", "blocks"),
-        ("herdr", "panes"),
-    ];
-    const MANAGED_VARIANTS: &[(&str, &[&str])] = &[
-        ("kitty", &["kitty-window", "kitty-tab", "kitty-split"]),
+    // Managed terminal families as (parent, description, variants). A preset
+    // is "managed" when it defines `close` — hcom can shut its agent window
+    // down on kill. The built-in list is hand-curated here for ordering and
+    // human-readable descriptions, but `is_managed_preset` below is the source
+    // of truth for section bucketing so a new managed preset never gets
+    // mis-listed under "Other (opens window only)".
+    const MANAGED: &[(&str, &str, &[&str])] = &[
+        (
+            "kitty",
+            "auto split/tab/window",
+            &["kitty-window", "kitty-tab", "kitty-split"],
+        ),
         (
             "wezterm",
+            "auto tab/split/window",
             &["wezterm-window", "wezterm-tab", "wezterm-split"],
         ),
-        ("tmux", &["tmux-split"]),
+        ("tmux", "detached sessions", &["tmux-split"]),
+        ("cmux", "workspaces", &[]),
+        ("zellij", "panes", &[]),
+        ("waveterm", "blocks", &[]),
+        ("herdr", "panes", &[]),
     ];
-
-    let all_managed: std::collections::HashSet<&str> = {
-        let mut s = std::collections::HashSet::new();
-        for (parent, _) in MANAGED_PARENTS {
-            s.insert(*parent);
-        }
-        for (_, variants) in MANAGED_VARIANTS {
-            for v in *variants {
-                s.insert(v);
-            }
-        }
-        s
+    let is_listed_managed = |name: &str| {
+        MANAGED
+            .iter()
+            .any(|(parent, _, variants)| *parent == name || variants.contains(&name))
     };
 
     // Check binary availability
@@ -1781,7 +1808,8 @@ pub fn terminal_help_text(show_current: bool) -> String {
 
     // Managed section
     lines.push("Managed (open + close on kill):".to_string());
-    for (parent, desc) in MANAGED_PARENTS {
+    let mut variant_lines = Vec::new();
+    for (parent, desc, variants) in MANAGED {
         // Skip if not on this platform
         let on_platform = TERMINAL_PRESETS
             .iter()
@@ -1792,28 +1820,22 @@ pub fn terminal_help_text(show_current: bool) -> String {
         }
         let mark = if is_available(parent) { "[+]" } else { "[-]" };
         lines.push(format!("  {mark} {:<14} {desc}", parent));
+        if !variants.is_empty() {
+            variant_lines.push(format!("    {parent}: {}", variants.join(", ")));
+        }
     }
     lines.push(String::new());
     lines.push("  Variants:".to_string());
-    for (parent, variants) in MANAGED_VARIANTS {
-        let on_platform = TERMINAL_PRESETS
-            .iter()
-            .find(|(n, _)| n == parent)
-            .is_some_and(|(_n, p)| p.platforms.is_empty() || p.platforms.contains(&platform));
-        if !on_platform {
-            continue;
-        }
-        lines.push(format!("    {parent}: {}", variants.join(", ")));
-    }
+    lines.append(&mut variant_lines);
 
     // Other (open-only, platform-filtered). Bucket by `close` presence rather
-    // than the hand-curated MANAGED_PARENTS list, so any built-in preset that
+    // than the hand-curated MANAGED table, so any built-in preset that
     // grows a close command later doesn't silently land in the wrong section.
     lines.push(String::new());
     lines.push("Other (opens window only):".to_string());
     for (name, preset) in TERMINAL_PRESETS.iter() {
         let has_close = preset.close.default.is_some() || preset.close.windows.is_some();
-        if all_managed.contains(name) || has_close {
+        if is_listed_managed(name) || has_close {
             continue;
         }
         if !preset.platforms.is_empty() && !preset.platforms.contains(&platform) {
@@ -1825,7 +1847,7 @@ pub fn terminal_help_text(show_current: bool) -> String {
 
     // TOML-defined presets not in built-ins
     let toml_path = crate::paths::config_toml_path();
-    let toml_presets: Vec<(String, bool)> = crate::config::load_toml_presets(&toml_path)
+    let toml_presets: Vec<(String, bool, bool)> = crate::config::load_toml_presets(&toml_path)
         .and_then(|p| {
             p.as_table().map(|t| {
                 t.iter()
@@ -1836,7 +1858,13 @@ pub fn terminal_help_text(show_current: bool) -> String {
                             v.as_str().is_some_and(|s| !s.is_empty())
                                 || v.as_array().is_some_and(|a| !a.is_empty())
                         });
-                        (name.clone(), has_close)
+                        // Availability from the table already loaded, rather than
+                        // re-reading config.toml per preset via get_merged_preset.
+                        let available = val
+                            .get("binary")
+                            .and_then(|v| v.as_str())
+                            .is_none_or(|b| crate::terminal::which_bin(b).is_some());
+                        (name.clone(), has_close, available)
                     })
                     .collect()
             })
@@ -1845,21 +1873,13 @@ pub fn terminal_help_text(show_current: bool) -> String {
     if !toml_presets.is_empty() {
         lines.push(String::new());
         lines.push("Custom presets (config.toml):".to_string());
-        for (name, has_close) in &toml_presets {
+        for (name, has_close, available) in &toml_presets {
             let kind = if *has_close {
                 "open + close"
             } else {
                 "open only"
             };
-            let mark = if crate::config::get_merged_preset(name)
-                .and_then(|p| p.binary)
-                .map(|b| crate::terminal::which_bin(&b).is_some())
-                .unwrap_or(true)
-            {
-                "[+]"
-            } else {
-                "[-]"
-            };
+            let mark = if *available { "[+]" } else { "[-]" };
             lines.push(format!("  {mark} {:<14} ({kind})", name));
         }
     }
@@ -2102,8 +2122,9 @@ fn show_kitty_status(preset_name: &str) {
         }
     };
 
-    let has_rc = kitty_conf_has(&conf, "allow_remote_control");
-    let has_listen = kitty_conf_has(&conf, "listen_on");
+    let mut kitty_conf = load_kitty_conf(&conf);
+    let has_rc = kitty_conf.remove("allow_remote_control");
+    let has_listen = kitty_conf.remove("listen_on");
 
     match (has_rc.as_deref(), &has_listen) {
         (Some("yes" | "socket"), Some(_)) => {
@@ -2122,13 +2143,26 @@ fn show_kitty_status(preset_name: &str) {
 
 // ── Kitty Setup (C4) ─────────────────────────────────────────────────────
 
-/// Find kitty.conf path.
+/// Find kitty.conf path by probing kitty's own config dir lookup order
+/// (`$KITTY_CONFIG_DIRECTORY`, `$XDG_CONFIG_HOME/kitty`, `~/.config/kitty`,
+/// and `~/Library/Preferences/kitty` on macOS) — no need to spawn kitty.
 fn find_kitty_conf() -> Option<PathBuf> {
+    let env_dir = |var: &str| {
+        std::env::var_os(var)
+            .filter(|v| !v.is_empty())
+            .map(PathBuf::from)
+    };
+    let home = dirs::home_dir();
     let candidates = [
+        env_dir("KITTY_CONFIG_DIRECTORY").map(|d| d.join("kitty.conf")),
+        env_dir("XDG_CONFIG_HOME").map(|d| d.join("kitty/kitty.conf")),
         dirs::config_dir().map(|d| d.join("kitty/kitty.conf")),
-        dirs::home_dir().map(|h| h.join(".config/kitty/kitty.conf")),
+        home.as_ref().map(|h| h.join(".config/kitty/kitty.conf")),
+        home.as_ref()
+            .filter(|_| cfg!(target_os = "macos"))
+            .map(|h| h.join("Library/Preferences/kitty/kitty.conf")),
     ];
-    candidates.into_iter().flatten().find(|p| p.exists())
+    candidates.into_iter().flatten().find(|p| p.is_file())
 }
 
 /// Find kitty remote control socket.
@@ -2137,22 +2171,26 @@ fn find_kitty_socket() -> Option<PathBuf> {
     candidates.into_iter().find(|p| p.exists())
 }
 
-/// Check if kitty.conf contains a specific key (exact match via whitespace split).
-fn kitty_conf_has(path: &Path, key: &str) -> Option<String> {
-    let content = std::fs::read_to_string(path).ok()?;
+/// Parse kitty.conf into `key -> value` for uncommented lines (first occurrence
+/// wins, key matched exactly via whitespace split). Read once per caller so
+/// checking several keys doesn't re-open and re-scan the file.
+fn load_kitty_conf(path: &Path) -> std::collections::HashMap<String, String> {
+    let mut conf = std::collections::HashMap::new();
+    let Ok(content) = std::fs::read_to_string(path) else {
+        return conf;
+    };
     for line in content.lines() {
         let line = line.trim();
         if line.starts_with('#') {
             continue;
         }
         let mut parts = line.splitn(2, |c: char| c.is_whitespace());
-        if let (Some(k), Some(v)) = (parts.next(), parts.next())
-            && k == key
-        {
-            return Some(v.trim().to_string());
+        if let (Some(k), Some(v)) = (parts.next(), parts.next()) {
+            conf.entry(k.to_string())
+                .or_insert_with(|| v.trim().to_string());
         }
     }
-    None
+    conf
 }
 
 /// Configure kitty for remote control (splits/tabs).
@@ -2173,8 +2211,9 @@ fn kitty_setup() -> i32 {
         }
     };
 
-    let has_rc = kitty_conf_has(&conf, "allow_remote_control");
-    let has_listen = kitty_conf_has(&conf, "listen_on");
+    let mut kitty_conf = load_kitty_conf(&conf);
+    let has_rc = kitty_conf.remove("allow_remote_control");
+    let has_listen = kitty_conf.remove("listen_on");
 
     if matches!(has_rc.as_deref(), Some("yes" | "socket")) && has_listen.is_some() {
         println!(
@@ -2228,8 +2267,7 @@ fn kitty_setup() -> i32 {
 
 /// Update tool permissions when auto_approve changes.
 fn update_auto_approve_permissions(value: &str) -> bool {
-    let normalized = value.to_ascii_lowercase();
-    let enabled = !matches!(normalized.as_str(), "0" | "false" | "no" | "off" | "");
+    let enabled = !crate::config::is_falsy(value);
     let failures = super::hooks::refresh_installed_hook_permissions(enabled);
 
     if enabled {
@@ -2341,6 +2379,53 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_is_valid_instance_tag() {
+        assert!(is_valid_instance_tag(""));
+        assert!(is_valid_instance_tag("team_alpha-2"));
+        assert!(!is_valid_instance_tag("bad tag"));
+        assert!(!is_valid_instance_tag("bad!"));
+        assert!(is_valid_instance_tag("équipe-1"));
+        assert!(!is_valid_instance_tag("équipe 1"));
+    }
+
+    #[test]
+    fn test_relay_token_preview() {
+        assert_eq!(relay_token_preview("abcdefgh"), "abcd");
+        assert_eq!(relay_token_preview("ab"), "ab");
+        assert_eq!(relay_token_preview("ééééé"), "éééé");
+    }
+
+    #[test]
+    fn test_relay_token_json_display_masks_by_chars() {
+        assert_eq!(relay_token_json_display("abcdefgh".into()), "abcd***");
+        assert_eq!(relay_token_json_display("abcd".into()), "abcd");
+        // 3 chars / 6 bytes: short token, never rendered as `<token>***`
+        assert_eq!(relay_token_json_display("ééé".into()), "ééé");
+        assert_eq!(relay_token_json_display("ééééé".into()), "éééé***");
+    }
+
+    #[test]
+    fn test_load_kitty_conf_first_uncommented_value_wins() {
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join("kitty.conf");
+        std::fs::write(
+            &path,
+            "# allow_remote_control no\nallow_remote_control  socket \nallow_remote_control yes\nlisten_on unix:/tmp/kitty\n",
+        )
+        .unwrap();
+        let conf = load_kitty_conf(&path);
+        assert_eq!(
+            conf.get("allow_remote_control").map(String::as_str),
+            Some("socket")
+        );
+        assert_eq!(
+            conf.get("listen_on").map(String::as_str),
+            Some("unix:/tmp/kitty")
+        );
+        assert!(load_kitty_conf(&dir.path().join("missing.conf")).is_empty());
+    }
+
     #[test]
     fn test_config_dev_root_set_get_unset() {
         use clap::Parser;
@@ -235,15 +235,21 @@ fn render_remote_kill_feedback(
 /// Run the kill command.
 pub fn run(argv: &[String], flags: &GlobalFlags) -> Result<i32> {
     // Filter out global flags already consumed by the router
-    let mut filtered = vec!["kill".to_string()];
+    let mut filtered = Vec::with_capacity(argv.len());
+    filtered.push("kill".to_string());
     let mut skip_next = false;
+    let mut skipped_cmd = false;
     for arg in argv {
         if skip_next {
             skip_next = false;
             continue;
         }
         match arg.as_str() {
-            "kill" | "--go" => continue,
+            "kill" if !skipped_cmd => {
+                skipped_cmd = true;
+                continue;
+            }
+            "--go" => continue,
             "--name" => {
                 skip_next = true;
                 continue;
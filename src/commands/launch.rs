@@ -15,6 +15,7 @@ use crate::router::GlobalFlags;
 use crate::shared::HcomContext;
 use anyhow::{Result, bail};
 use serde_json::json;
+use std::fmt::Write as _;
 use std::time::Instant;
 
 pub(crate) const INLINE_SINGLE_LAUNCH_WAIT_SECS: u64 = 10;
@@ -41,7 +42,12 @@ pub fn run(argv: &[String], flags: &GlobalFlags) -> Result<i32> {
     let tag_for_output = tag.clone();
     let terminal_for_output = terminal.clone();
 
-    let hcom_config = load_hcom_config();
+    // Hand the config to launcher::launch only when it loaded cleanly; on
+    // failure the launcher reloads and prints its defaults warning.
+    let (hcom_config, config_loaded) = match HcomConfig::load(None) {
+        Ok(config) => (config, true),
+        Err(_) => (default_hcom_config(), false),
+    };
     let preview_background = headless || is_background_from_args(&launch_tool, &tool_args);
 
     let ctx = HcomContext::from_os();
@@ -105,8 +111,7 @@ pub fn run(argv: &[String], flags: &GlobalFlags) -> Result<i32> {
             Ok(inner) => {
                 let launch_result = launch_result_from_json(&inner).map_err(anyhow::Error::msg)?;
                 let remote_output = build_remote_launch_output(
-                    &db,
-                    flags,
+                    launcher_name,
                     &launch_result,
                     tag_for_output.clone(),
                     terminal_for_output.clone(),
@@ -199,6 +204,7 @@ pub fn run(argv: &[String], flags: &GlobalFlags) -> Result<i32> {
             skip_validation: false,
             terminal,
             append_reply_handoff: true,
+            hcom_config: config_loaded.then(|| hcom_config.clone()),
         },
     )?;
 
@@ -288,15 +294,12 @@ struct RemoteLaunchOutput {
 }
 
 fn build_remote_launch_output(
-    db: &HcomDb,
-    flags: &GlobalFlags,
+    launcher_name: String,
     launch_result: &LaunchResult,
     tag: Option<String>,
     terminal: Option<String>,
     run_here: Option<bool>,
 ) -> RemoteLaunchOutput {
-    let launcher_name =
-        resolve_launcher_name(db, flags, std::env::var("HCOM_PROCESS_ID").ok().as_deref());
     RemoteLaunchOutput {
         tool: launch_result.tool.clone(),
         tag,
@@ -392,40 +395,42 @@ pub(crate) fn print_launch_preview(preview: LaunchPreview<'_>) {
         .or_else(|| std::env::var("HCOM_TERMINAL").ok())
         .unwrap_or_else(|| preview.config.terminal.clone());
 
-    println!("\n== LAUNCH PREVIEW ==");
-    println!("Add --go to proceed.\n");
-    println!("Action: {}", preview.action);
-    println!(
+    // Assemble the whole block and write it once.
+    let mut out = String::from("\n== LAUNCH PREVIEW ==\nAdd --go to proceed.\n\n");
+    let _ = writeln!(out, "Action: {}", preview.action);
+    let _ = writeln!(
+        out,
         "Tool: {:<10} Count: {:<4} Mode: {}",
         preview.tool, preview.count, mode
     );
-    println!("Directory: {}", cwd);
-    println!("Terminal: {}", terminal);
+    let _ = writeln!(out, "Directory: {}", cwd);
+    let _ = writeln!(out, "Terminal: {}", terminal);
     if let Some(t) = preview.tag {
-        println!("Tag: {} (names will be {}-*)", t, t);
+        let _ = writeln!(out, "Tag: {} (names will be {}-*)", t, t);
     }
     for note in preview.notes {
-        println!("{note}");
+        let _ = writeln!(out, "{note}");
     }
 
     // Args — only show if there's something to show
     if !env_args.is_empty() || !preview.args.is_empty() {
-        println!("\nArgs:");
+        out.push_str("\nArgs:\n");
         if !env_args.is_empty() {
-            match args_key {
-                Some(key) => println!("  From config ({}): {}", key, env_args),
-                None => println!("  From config: {}", env_args),
-            }
+            let _ = match args_key {
+                Some(key) => writeln!(out, "  From config ({}): {}", key, env_args),
+                None => writeln!(out, "  From config: {}", env_args),
+            };
         }
         if !preview.args.is_empty() {
-            println!("  From CLI: {}", preview.args.join(" "));
+            let _ = writeln!(out, "  From CLI: {}", preview.args.join(" "));
         }
         if !env_args.is_empty() && !preview.args.is_empty() {
-            println!(
-                "  (config args are passed first, then CLI args; the tool resolves duplicates)"
+            out.push_str(
+                "  (config args are passed first, then CLI args; the tool resolves duplicates)\n",
             );
         }
     }
+    print!("{out}");
 }
 
 /// Hcom-level flags extracted from launch argv.
@@ -565,11 +570,13 @@ pub(crate) fn is_background_from_args(tool: &LaunchTool, args: &[String]) -> boo
 }
 
 pub(crate) fn load_hcom_config() -> HcomConfig {
-    HcomConfig::load(None).unwrap_or_else(|_| {
-        let mut c = HcomConfig::default();
-        c.normalize();
-        c
-    })
+    HcomConfig::load(None).unwrap_or_else(|_| default_hcom_config())
+}
+
+fn default_hcom_config() -> HcomConfig {
+    let mut c = HcomConfig::default();
+    c.normalize();
+    c
 }
 
 pub(crate) fn extract_launch_flags(args: &[String]) -> (HcomLaunchFlags, Vec<String>) {
@@ -1253,15 +1260,8 @@ mod tests {
 
     #[test]
     fn test_build_remote_launch_output_prefers_remote_background() {
-        crate::config::Config::init();
-        let dir = tempfile::tempdir().unwrap();
-        let db_path = dir.path().join("test.db");
-        let db = HcomDb::open_raw(&db_path).unwrap();
-        db.init_db().unwrap();
-
         let output = build_remote_launch_output(
-            &db,
-            &GlobalFlags::default(),
+            "luna".to_string(),
             &LaunchResult {
                 tool: "claude".to_string(),
                 batch_id: "batch-1".to_string(),
@@ -1278,6 +1278,7 @@ mod tests {
         );
 
         assert_eq!(output.tool, "claude");
+        assert_eq!(output.launcher_name, "luna");
         assert_eq!(output.tag.as_deref(), Some("ops"));
         assert_eq!(output.terminal.as_deref(), Some("kitty"));
         assert!(!output.background);
@@ -1286,15 +1287,8 @@ mod tests {
 
     #[test]
     fn test_build_remote_launch_output_uses_remote_launch_result_background() {
-        crate::config::Config::init();
-        let dir = tempfile::tempdir().unwrap();
-        let db_path = dir.path().join("test.db");
-        let db = HcomDb::open_raw(&db_path).unwrap();
-        db.init_db().unwrap();
-
         let output = build_remote_launch_output(
-            &db,
-            &GlobalFlags::default(),
+            "luna".to_string(),
             &LaunchResult {
                 tool: "codex".to_string(),
                 batch_id: "batch-2".to_string(),
@@ -103,8 +103,9 @@ pub fn cmd_list(db: &HcomDb, args: &ListArgs, ctx: Option<&CommandContext>) -> i
     let field_name = args.field.as_deref();
 
     // Resolve current instance identity
-    let (sender_identity, current_name) = if let Some(id) = ctx.and_then(|c| c.identity.as_ref()) {
-        (Some(id.clone()), Some(id.name.clone()))
+    let (sender_identity, current_name) = if let Some(c) = ctx {
+        let name = c.identity.as_ref().map(|id| id.name.clone());
+        (c.identity.clone(), name)
     } else if let Some(name) = explicit_name {
         match identity::resolve_identity(db, Some(name), None, None, None, None, None) {
             Ok(id) => {
@@ -366,6 +367,11 @@ pub fn cmd_list(db: &HcomDb, args: &ListArgs, ctx: Option<&CommandContext>) -> i
     }
     let name_col_width = (max_name_len + 2).max(14);
 
+    // Config fallback for subagents without a stored timeout: parse config.toml
+    // at most once per listing rather than once per subagent row.
+    let default_subagent_timeout =
+        std::cell::LazyCell::new(|| crate::config::load_config_snapshot().core.subagent_timeout);
+
     for data in &sorted_instances {
         let name = get_full_name(data);
         let cs = get_instance_status(data, db);
@@ -441,7 +447,7 @@ pub fn cmd_list(db: &HcomDb, args: &ListArgs, ctx: Option<&CommandContext>) -> i
             } else {
                 None
             }
-            .unwrap_or_else(|| crate::config::load_config_snapshot().core.subagent_timeout);
+            .unwrap_or_else(|| *default_subagent_timeout);
             let remaining = timeout.saturating_sub(cs.age_seconds);
             if remaining > 0 && remaining < 10 {
                 format!(" \u{23f1} {remaining}s")
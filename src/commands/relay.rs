@@ -146,9 +146,10 @@ fn relay_status(db: &HcomDb) -> i32 {
     }
 
     // All status display branches off the canonical RelayHealth derivation so
-    // CLI / TUI / JSON can't drift in interpretation of the underlying KV.
-    let health = relay::relay_health(&config, db);
-    match &health {
+    // CLI / TUI / JSON can't drift in interpretation of the underlying KV. The
+    // same observation also carries last_push, so it isn't read twice.
+    let status = relay::get_relay_status(&config, db);
+    match &status.health {
         relay::RelayHealth::Connected => {
             println!("Status:    {FG_GREEN}connected{RESET}");
         }
@@ -179,10 +180,7 @@ fn relay_status(db: &HcomDb) -> i32 {
                     || err_text.contains("auth")
                     || err_text.contains("not authorized")
                 {
-                    let is_public = DEFAULT_BROKERS.iter().any(|&(h, p)| {
-                        config.relay == format!("mqtts://{h}:{p}")
-                            || config.relay == format!("mqtt://{h}:{p}")
-                    });
+                    let is_public = relay::token::public_broker_index(&config.relay).is_some();
                     if !is_public && config.relay_token.is_empty() {
                         println!("  Hint: use --password when connecting to private brokers");
                     }
@@ -241,14 +239,8 @@ fn relay_status(db: &HcomDb) -> i32 {
     }
 
     // Last push
-    let last_push: f64 = db
-        .kv_get("relay_last_push")
-        .ok()
-        .flatten()
-        .and_then(|s| s.parse().ok())
-        .unwrap_or(0.0);
-    if last_push > 0.0 {
-        println!("Last push: {}", format_time(last_push));
+    if status.last_push > 0.0 {
+        println!("Last push: {}", format_time(status.last_push));
     } else {
         println!("Last push: never");
     }
@@ -699,12 +691,25 @@ fn relay_connect(db: &HcomDb, argv: &[String]) -> i32 {
 
     let effective_broker = broker_url.unwrap_or(token_broker);
 
-    // Test broker connectivity
-    let ping_ms = relay::parse_broker_url(&effective_broker)
-        .and_then(|(host, port, use_tls)| ping_broker(&host, port, use_tls));
-
     let config = config::load_config_snapshot().core;
 
+    // Test broker connectivity, unless the worker already holds a live session
+    // to this broker for this group — its health is fresher than a new TLS
+    // handshake and costs only a KV read.
+    let already_connected = config.relay_enabled
+        && config.relay_id == relay_id
+        && config.relay == effective_broker
+        && matches!(
+            relay::get_relay_status(&config, db).health,
+            relay::RelayHealth::Connected
+        );
+    let ping_ms = if already_connected {
+        None
+    } else {
+        relay::parse_broker_url(&effective_broker)
+            .and_then(|(host, port, use_tls)| ping_broker(&host, port, use_tls))
+    };
+
     // Clear stale device state when switching groups
     if config.relay_id != relay_id {
         relay::clear_relay_device_state(db);
@@ -717,7 +722,9 @@ fn relay_connect(db: &HcomDb, argv: &[String]) -> i32 {
         return 1;
     }
 
-    if let Some(ms) = ping_ms {
+    if already_connected {
+        println!("Broker: {effective_broker} (connected)");
+    } else if let Some(ms) = ping_ms {
         println!("Broker: {effective_broker} ({ms}ms)");
     } else {
         println!("Broker: {effective_broker}");
@@ -728,11 +735,7 @@ fn relay_connect(db: &HcomDb, argv: &[String]) -> i32 {
     if auth_token.is_some() {
         println!("Password: set");
     } else {
-        let is_public = DEFAULT_BROKERS.iter().any(|&(h, p)| {
-            effective_broker == format!("mqtts://{h}:{p}")
-                || effective_broker == format!("mqtt://{h}:{p}")
-        });
-        if !is_public {
+        if relay::token::public_broker_index(&effective_broker).is_none() {
             println!("Password: not set (use --password if broker requires auth)");
         }
     }
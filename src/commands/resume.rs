@@ -159,7 +159,7 @@ pub fn do_resume(
         let launch_result =
             crate::commands::launch::launch_result_from_json(&inner).map_err(anyhow::Error::msg)?;
         let remote_output =
-            build_remote_resume_output(&db, &launch_result, extra_args, fork, flags);
+            build_remote_resume_output(&launch_result, extra_args, fork, launcher_name);
         let output = LaunchOutputContext {
             action: &remote_output.action,
             tool: &remote_output.tool,
@@ -339,16 +339,18 @@ fn prepare_resume_plan_from_source(
         display_name,
     ) = match source {
         ResumeSource::Instance { name } => {
+            // One instance-row read serves both the still-active guard (resume)
+            // and the live-data source (fork).
+            let row = db.get_instance_full(name).ok().flatten();
             if !fork
-                && let Ok(Some(inst)) = db.get_instance_full(name)
+                && let Some(inst) = &row
                 && inst.status != ST_INACTIVE
             {
                 bail!("'{}' is still active — run hcom kill {} first", name, name);
             }
-            let (tool, sid, largs, tag, bg, leid, snap) = if fork {
-                load_instance_data(db, name)?
-            } else {
-                load_stopped_snapshot(db, name)?
+            let (tool, sid, largs, tag, bg, leid, snap) = match row.filter(|_| fork) {
+                Some(inst) => instance_row_data(&inst),
+                None => load_stopped_snapshot(db, name)?,
             };
             (tool, sid, largs, tag, bg, leid, snap, name.to_string())
         }
@@ -379,7 +381,7 @@ fn prepare_resume_plan_from_source(
         );
     }
 
-    validate_resume_operation(&tool, fork)?;
+    let resume_tool = validate_resume_operation(&tool, fork)?;
     let inherited_tag = if tag.is_empty() {
         None
     } else {
@@ -429,11 +431,11 @@ fn prepare_resume_plan_from_source(
     let mut persisted_args = original_args.clone();
     persisted_args.extend(clean_extra.iter().cloned());
 
-    let mut cli_tool_args = build_resume_args(&tool, &session_id, fork);
+    let mut cli_tool_args = build_resume_args(resume_tool, &session_id, fork);
     cli_tool_args.extend(clean_extra);
 
     let merged_cli_args = if !original_args.is_empty() {
-        merge_resume_args(&tool, &original_args, &cli_tool_args)
+        merge_resume_args(resume_tool, &original_args, &cli_tool_args)
     } else {
         cli_tool_args
     };
@@ -557,6 +559,7 @@ fn prepare_resume_plan_from_source(
             // reset; don't dilute it with a reply-handoff suffix. Adoption-fork
             // has no identity-reset prompt, so normal handoff rules apply.
             append_reply_handoff,
+            hcom_config: None,
         },
         last_event_id,
         session_id,
@@ -678,15 +681,12 @@ fn prepare_launch_for_execution(db: &HcomDb, plan: &PreparedResume) -> Result<La
 }
 
 fn build_remote_resume_output(
-    db: &HcomDb,
     launch_result: &LaunchResult,
     extra_args: &[String],
     fork: bool,
-    flags: &GlobalFlags,
+    launcher_name: String,
 ) -> ResumeOutputContext {
     let (_dir_override, launch_flags, _clean_extra) = extract_resume_flags(extra_args);
-    let launcher_name =
-        resolve_launcher_name(db, flags, std::env::var("HCOM_PROCESS_ID").ok().as_deref());
 
     ResumeOutputContext {
         action: if fork { "fork" } else { "resume" }.to_string(),
@@ -774,14 +774,17 @@ fn should_preview_resume(
     !tool_args.is_empty() || *launch_flags != crate::commands::launch::HcomLaunchFlags::default()
 }
 
-fn validate_resume_operation(tool: &str, fork: bool) -> Result<()> {
+/// Resolve the saved tool name to its integration (claude-pty → Claude) and
+/// check it supports the requested operation. Callers reuse the returned tool
+/// rather than re-parsing the name.
+fn validate_resume_operation(tool: &str, fork: bool) -> Result<crate::tool::Tool> {
     let tool_lookup = if tool == "claude-pty" { "claude" } else { tool };
     let parsed = tool_lookup
         .parse::<crate::tool::Tool>()
         .map_err(|_| anyhow::anyhow!("Unknown tool '{}' in saved session metadata", tool))?;
 
     if !fork {
-        return Ok(());
+        return Ok(parsed);
     }
     // Drive fork support from the spec so help text and validation can't drift.
     // Accepts canonical names + aliases (e.g. `"agy"` → Antigravity).
@@ -789,7 +792,7 @@ fn validate_resume_operation(tool: &str, fork: bool) -> Result<()> {
     if spec.resume.and_then(|r| r.fork).is_none() {
         bail!("{} does not support session forking (hcom f)", spec.label);
     }
-    Ok(())
+    Ok(parsed)
 }
 
 fn build_resume_prompts(input: ResumePromptInput<'_>) -> (Option<String>, Option<String>, bool) {
@@ -884,26 +887,19 @@ fn resume_system_prompt(tool: &str, name: &str, fork: bool, child_name: Option<&
     }
 }
 
-/// Load data from an active or stopped instance.
-fn load_instance_data(
-    db: &HcomDb,
-    name: &str,
-) -> Result<(String, String, String, String, bool, i64, String)> {
-    // Try active instance first
-    if let Ok(Some(inst)) = db.get_instance_full(name) {
-        return Ok((
-            inst.tool.clone(),
-            inst.session_id.as_deref().unwrap_or("").to_string(),
-            inst.launch_args.as_deref().unwrap_or("").to_string(),
-            inst.tag.as_deref().unwrap_or("").to_string(),
-            inst.background != 0,
-            inst.last_event_id,
-            inst.directory.clone(),
-        ));
-    }
-
-    // Fall back to stopped snapshot
-    load_stopped_snapshot(db, name)
+/// Resume data from a live instance row (fork of an active instance).
+fn instance_row_data(
+    inst: &crate::db::InstanceRow,
+) -> (String, String, String, String, bool, i64, String) {
+    (
+        inst.tool.clone(),
+        inst.session_id.as_deref().unwrap_or("").to_string(),
+        inst.launch_args.as_deref().unwrap_or("").to_string(),
+        inst.tag.as_deref().unwrap_or("").to_string(),
+        inst.background != 0,
+        inst.last_event_id,
+        inst.directory.clone(),
+    )
 }
 
 /// Load stopped snapshot from life events.
@@ -985,47 +981,40 @@ fn load_stopped_snapshot(
 }
 
 /// Build tool-specific resume/fork args from the integration spec.
-fn build_resume_args(tool: &str, session_id: &str, fork: bool) -> Vec<String> {
+fn build_resume_args(tool: crate::tool::Tool, session_id: &str, fork: bool) -> Vec<String> {
     use crate::integration_spec::{ForkArgs, ResumeArgs};
-    // claude-pty resolves to the Claude spec.
-    let tool_lookup = if tool == "claude-pty" { "claude" } else { tool };
-    let Ok(tool_enum) = tool_lookup.parse::<crate::tool::Tool>() else {
-        return Vec::new();
-    };
-    let Some(resume_spec) = tool_enum.spec().resume.as_ref() else {
+    let Some(resume_spec) = tool.spec().resume.as_ref() else {
         return Vec::new();
     };
 
-    let mut args = match resume_spec.resume {
-        ResumeArgs::Flag(flag) => vec![flag.to_string(), session_id.to_string()],
-        ResumeArgs::Subcommand(sub) => vec![sub.to_string(), session_id.to_string()],
+    let fork_spec = if fork {
+        resume_spec.fork.as_ref()
+    } else {
+        None
     };
-
-    if fork {
-        match resume_spec.fork {
-            Some(ForkArgs::AppendFlag(flag)) => args.push(flag.to_string()),
-            Some(ForkArgs::Subcommand(sub)) => {
-                // Replace the resume subcommand with the fork subcommand.
-                if let Some(first) = args.first_mut() {
-                    *first = sub.to_string();
-                }
-            }
-            None => {}
-        }
+    // A fork subcommand replaces the resume flag/subcommand; a fork flag is
+    // appended after the session id. Build the final shape in one allocation.
+    let verb = match (fork_spec, &resume_spec.resume) {
+        (Some(ForkArgs::Subcommand(sub)), _) => sub,
+        (_, ResumeArgs::Flag(verb) | ResumeArgs::Subcommand(verb)) => verb,
+    };
+    let mut args = Vec::with_capacity(3);
+    args.push(verb.to_string());
+    args.push(session_id.to_string());
+    if let Some(ForkArgs::AppendFlag(flag)) = fork_spec {
+        args.push(flag.to_string());
     }
-
     args
 }
 
 /// Merge original launch args with resume-specific args.
-fn merge_resume_args(tool: &str, original: &[String], resume: &[String]) -> Vec<String> {
+fn merge_resume_args(
+    tool: crate::tool::Tool,
+    original: &[String],
+    resume: &[String],
+) -> Vec<String> {
     // Claude/Gemini/Codex stay grammar-free: preserve the stored user/config
     // vector verbatim and append hcom's resume injection.
-    let tool_lookup = if tool == "claude-pty" { "claude" } else { tool };
-    let tool = tool_lookup
-        .parse::<crate::tool::Tool>()
-        .expect("resume tool must be validated before argument merging");
-
     match tool {
         crate::tool::Tool::Claude | crate::tool::Tool::Gemini | crate::tool::Tool::Codex => {
             let mut merged = original.to_vec();
@@ -2234,6 +2223,7 @@ fn build_adopt_plan(
 mod tests {
     use super::*;
     use crate::db::HcomDb;
+    use crate::tool::Tool;
 
     fn s(items: &[&str]) -> Vec<String> {
         items.iter().map(|i| i.to_string()).collect()
@@ -2270,13 +2260,13 @@ mod tests {
 
     #[test]
     fn test_build_resume_args_claude() {
-        let args = build_resume_args("claude", "sess-123", false);
+        let args = build_resume_args(Tool::Claude, "sess-123", false);
         assert_eq!(args, s(&["--resume", "sess-123"]));
     }
 
     #[test]
     fn test_build_resume_args_claude_fork() {
-        let args = build_resume_args("claude", "sess-123", true);
+        let args = build_resume_args(Tool::Claude, "sess-123", true);
         assert_eq!(args, s(&["--resume", "sess-123", "--fork-session"]));
     }
 
@@ -2306,25 +2296,25 @@ mod tests {
 
     #[test]
     fn test_build_resume_args_codex_resume() {
-        let args = build_resume_args("codex", "sess-456", false);
+        let args = build_resume_args(Tool::Codex, "sess-456", false);
         assert_eq!(args, s(&["resume", "sess-456"]));
     }
 
     #[test]
     fn test_build_resume_args_codex_fork() {
-        let args = build_resume_args("codex", "sess-456", true);
+        let args = build_resume_args(Tool::Codex, "sess-456", true);
         assert_eq!(args, s(&["fork", "sess-456"]));
     }
 
     #[test]
     fn test_build_resume_args_gemini() {
-        let args = build_resume_args("gemini", "sess-789", false);
+        let args = build_resume_args(Tool::Gemini, "sess-789", false);
         assert_eq!(args, s(&["--resume", "sess-789"]));
     }
 
     #[test]
     fn test_build_resume_args_omp_resume() {
-        let args = build_resume_args("omp", "sess-omp", false);
+        let args = build_resume_args(Tool::Omp, "sess-omp", false);
         assert_eq!(args, s(&["--resume", "sess-omp"]));
     }
 
@@ -2335,7 +2325,7 @@ mod tests {
         // SessionManager.forkFrom(...). Same shape as Pi — fork must emit
         // `["--fork", <id>]`, replacing `--resume`, not `["--resume", <id>,
         // "--fork"]`. hcom must not degrade `hcom f` into a plain `--resume`.
-        let args = build_resume_args("omp", "sess-omp", true);
+        let args = build_resume_args(Tool::Omp, "sess-omp", true);
         assert_eq!(args, s(&["--fork", "sess-omp"]));
     }
 
@@ -2586,7 +2576,7 @@ mod tests {
 
     #[test]
     fn test_build_resume_args_antigravity_resume() {
-        let args = build_resume_args("antigravity", "conv-abc", false);
+        let args = build_resume_args(Tool::Antigravity, "conv-abc", false);
         assert_eq!(args, s(&["--conversation", "conv-abc"]));
     }
 
@@ -2606,6 +2596,14 @@ mod tests {
         assert!(validate_resume_operation("antigravity", false).is_ok());
     }
 
+    #[test]
+    fn test_validate_resume_operation_resolves_claude_pty() {
+        assert_eq!(
+            validate_resume_operation("claude-pty", true).unwrap(),
+            Tool::Claude
+        );
+    }
+
     #[test]
     fn test_validate_resume_operation_rejects_agy_alias_fork() {
         // The alias is launcher-canonicalised today, but fork validation must
@@ -2624,7 +2622,7 @@ mod tests {
     fn test_merge_resume_args_antigravity_strips_session_and_prompt_flags() {
         // --conversation (value-consuming), --continue/-c (bare), --prompt-interactive (value), -p (bare)
         let merged = merge_resume_args(
-            "antigravity",
+            Tool::Antigravity,
             &s(&[
                 "--conversation",
                 "old-conv",
@@ -2642,7 +2640,7 @@ mod tests {
     #[test]
     fn test_merge_resume_args_antigravity_preserves_sandbox_and_add_dir() {
         let merged = merge_resume_args(
-            "antigravity",
+            Tool::Antigravity,
             &s(&["--sandbox", "--add-dir", "/some/path"]),
             &s(&["--conversation", "conv-xyz"]),
         );
@@ -2663,7 +2661,7 @@ mod tests {
     #[test]
     fn test_merge_resume_args_antigravity_strips_equals_form() {
         let merged = merge_resume_args(
-            "antigravity",
+            Tool::Antigravity,
             &s(&[
                 "--conversation=old-id",
                 "--sandbox",
@@ -2679,7 +2677,7 @@ mod tests {
     #[test]
     fn test_merge_resume_args_antigravity_strips_single_dash_long_form() {
         let merged = merge_resume_args(
-            "antigravity",
+            Tool::Antigravity,
             &s(&[
                 "-conversation",
                 "old-id",
@@ -2698,7 +2696,7 @@ mod tests {
     #[test]
     fn test_merge_resume_args_cursor_preserves_config_drops_prompt_and_session() {
         let merged = merge_resume_args(
-            "cursor",
+            Tool::Cursor,
             &s(&[
                 "--model",
                 "composer-2.5",
@@ -2727,7 +2725,7 @@ mod tests {
     #[test]
     fn test_merge_resume_args_cursor_strips_workspace_worktree_continue() {
         let merged = merge_resume_args(
-            "cursor",
+            Tool::Cursor,
             &s(&[
                 "--workspace",
                 "/old/path",
@@ -2748,7 +2746,7 @@ mod tests {
     #[test]
     fn test_merge_resume_args_cursor_equals_form_and_header() {
         let merged = merge_resume_args(
-            "cursor",
+            Tool::Cursor,
             &s(&[
                 "--model=sonnet-4",
                 "--resume=old",
@@ -2770,7 +2768,7 @@ mod tests {
     #[test]
     fn test_merge_resume_args_cursor_resume_value_beats_baked() {
         let merged = merge_resume_args(
-            "cursor",
+            Tool::Cursor,
             &s(&["--model", "y", "-H", "X-Baked: 1", "--force", "stale task"]),
             &s(&["--resume", "sid", "--model", "x", "-H", "X-Resume: 1"]),
         );
@@ -2797,7 +2795,7 @@ mod tests {
     #[test]
     fn test_merge_resume_args_cursor_preserves_print_flags_for_validation() {
         let merged = merge_resume_args(
-            "cursor",
+            Tool::Cursor,
             &s(&[
                 "-p",
                 "--print",
@@ -2864,7 +2862,7 @@ mod tests {
     #[test]
     fn test_merge_resume_args_opencode_preserves_non_session_flags() {
         let merged = merge_resume_args(
-            "opencode",
+            Tool::OpenCode,
             &s(&[
                 "--model",
                 "openai/gpt-5.4",
@@ -2894,7 +2892,7 @@ mod tests {
     #[test]
     fn test_merge_resume_args_opencode_strips_equals_form_session_and_prompt() {
         let merged = merge_resume_args(
-            "opencode",
+            Tool::OpenCode,
             &s(&[
                 "--session=old-sess",
                 "--prompt=old prompt",
@@ -2916,13 +2914,13 @@ mod tests {
 
     #[test]
     fn test_build_resume_args_opencode_fork() {
-        let args = build_resume_args("opencode", "sess-000", true);
+        let args = build_resume_args(Tool::OpenCode, "sess-000", true);
         assert_eq!(args, s(&["--session", "sess-000", "--fork"]));
     }
 
     #[test]
     fn test_build_resume_args_kilo_fork() {
-        let args = build_resume_args("kilo", "sess-000", true);
+        let args = build_resume_args(Tool::Kilo, "sess-000", true);
         assert_eq!(args, s(&["--session", "sess-000", "--fork"]));
     }
 
@@ -2932,14 +2930,14 @@ mod tests {
         // with `--session` (pi errors "--fork cannot be combined with
         // --session"), so fork must emit `["--fork", <id>]`, not
         // `["--session", <id>, "--fork"]`.
-        let args = build_resume_args("pi", "sess-000", true);
+        let args = build_resume_args(Tool::Pi, "sess-000", true);
         assert_eq!(args, s(&["--fork", "sess-000"]));
     }
 
     #[test]
     fn test_merge_resume_args_pi_strips_session_controls_and_positional_prompt() {
         let merged = merge_resume_args(
-            "pi",
+            Tool::Pi,
             &s(&[
                 "--model",
                 "claude-3-5-sonnet",
@@ -2961,7 +2959,7 @@ mod tests {
     #[test]
     fn test_merge_resume_args_kilo_preserves_non_session_flags() {
         let merged = merge_resume_args(
-            "kilo",
+            Tool::Kilo,
             &s(&["--model", "kilo/kilo-auto/free", "--prompt", "old prompt"]),
             &s(&["--session", "new-sess"]),
         );
@@ -3202,9 +3200,7 @@ mod tests {
 
     #[test]
     fn test_build_remote_resume_output_uses_actual_launch_result_background() {
-        let db = test_db();
         let output = build_remote_resume_output(
-            &db,
             &LaunchResult {
                 tool: "claude".to_string(),
                 batch_id: "batch-1".to_string(),
@@ -3217,10 +3213,11 @@ mod tests {
             },
             &s(&["--terminal", "kitty", "--tag", "ops", "--run-here"]),
             false,
-            &GlobalFlags::default(),
+            "luna".to_string(),
         );
 
         assert_eq!(output.action, "resume");
+        assert_eq!(output.launcher_name, "luna");
         assert_eq!(output.tool, "claude");
         assert_eq!(output.tag.as_deref(), Some("ops"));
         assert_eq!(output.terminal.as_deref(), Some("kitty"));
@@ -3230,9 +3227,7 @@ mod tests {
 
     #[test]
     fn test_build_remote_resume_output_marks_fork_action() {
-        let db = test_db();
         let output = build_remote_resume_output(
-            &db,
             &LaunchResult {
                 tool: "codex".to_string(),
                 batch_id: "batch-2".to_string(),
@@ -3245,7 +3240,7 @@ mod tests {
             },
             &[],
             true,
-            &GlobalFlags::default(),
+            "luna".to_string(),
         );
 
         assert_eq!(output.action, "fork");
@@ -3556,14 +3551,14 @@ mod tests {
 
     #[test]
     fn test_build_resume_args_copilot() {
-        let args = build_resume_args("copilot", "sess-abc", false);
+        let args = build_resume_args(Tool::Copilot, "sess-abc", false);
         assert_eq!(args, s(&["--resume", "sess-abc"]));
     }
 
     #[test]
     fn test_build_resume_args_copilot_fork_rejected() {
         // copilot has fork: None, so build_resume_args returns resume-only args
-        let args = build_resume_args("copilot", "sess-abc", true);
+        let args = build_resume_args(Tool::Copilot, "sess-abc", true);
         assert_eq!(args, s(&["--resume", "sess-abc"]));
     }
 
@@ -3571,7 +3566,7 @@ mod tests {
     fn test_merge_copilot_args_preserves_model_drops_prompt() {
         let original = s(&["--model", "claude-haiku-4.5", "-i", "do a task"]);
         let resume = s(&["--resume", "sess-abc"]);
-        let merged = merge_resume_args("copilot", &original, &resume);
+        let merged = merge_resume_args(Tool::Copilot, &original, &resume);
         assert!(merged.contains(&"--resume".to_string()));
         assert!(merged.contains(&"sess-abc".to_string()));
         assert!(merged.contains(&"--model".to_string()));
@@ -3585,7 +3580,7 @@ mod tests {
     fn test_merge_copilot_args_resume_model_wins() {
         let original = s(&["--model", "claude-haiku-4.5", "-i", "task"]);
         let resume = s(&["--resume", "sess-abc", "--model", "claude-sonnet-4-5"]);
-        let merged = merge_resume_args("copilot", &original, &resume);
+        let merged = merge_resume_args(Tool::Copilot, &original, &resume);
         // Only one --model entry
         assert_eq!(merged.iter().filter(|t| t.as_str() == "--model").count(), 1);
         assert!(merged.contains(&"claude-sonnet-4-5".to_string()));
@@ -698,9 +698,10 @@ pub fn cmd_send(db: &HcomDb, args: &SendArgs, ctx: Option<&CommandContext>) -> i
 
     // Guard: subagents cannot use --from/-b
     if from_name.is_some() {
-        let actor_from_ctx = ctx.and_then(|c| c.identity.clone());
-        let actor = actor_from_ctx
-            .or_else(|| identity::resolve_identity(db, None, None, None, None, None, None).ok());
+        let actor = match ctx {
+            Some(c) => c.identity.clone(),
+            None => identity::resolve_identity(db, None, None, None, None, None, None).ok(),
+        };
         match actor {
             Some(ref actor) if matches!(actor.kind, SenderKind::Instance) => {
                 if let Some(ref data) = actor.instance_data
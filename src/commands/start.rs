@@ -45,15 +45,21 @@ pub struct StartArgs {
 /// Run the start command.
 pub fn run(argv: &[String], flags: &GlobalFlags) -> Result<i32> {
     // Filter out global flags already consumed by the router (start, --name X, --go)
-    let mut filtered = vec!["start".to_string()];
+    let mut filtered = Vec::with_capacity(argv.len());
+    filtered.push("start".to_string());
     let mut skip_next = false;
+    let mut skipped_cmd = false;
     for arg in argv {
         if skip_next {
             skip_next = false;
             continue;
         }
         match arg.as_str() {
-            "start" | "--go" => continue,
+            "start" if !skipped_cmd => {
+                skipped_cmd = true;
+                continue;
+            }
+            "--go" => continue,
             "--name" => {
                 skip_next = true;
                 continue;
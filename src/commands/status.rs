@@ -37,10 +37,11 @@ fn is_in_path(name: &str) -> bool {
     let Some(path_var) = std::env::var_os("PATH") else {
         return false;
     };
+    let names = crate::terminal::which_candidate_names(name);
     std::env::split_paths(&path_var).any(|dir| {
-        crate::terminal::which_candidates(&dir, name)
+        names
             .iter()
-            .any(|candidate| path_exists_or_symlink(candidate))
+            .any(|candidate| path_exists_or_symlink(&dir.join(candidate)))
     })
 }
 
@@ -256,11 +256,7 @@ pub fn cmd_stop(db: &HcomDb, args: &StopArgs, ctx: Option<&CommandContext>) -> i
     } else {
         // Self-stop: resolve identity
         let identity = if let Some(c) = ctx {
-            if let Some(ref id) = c.identity {
-                Some(id.clone())
-            } else {
-                identity::resolve_identity(db, explicit_name, None, None, None, None, None).ok()
-            }
+            c.identity.clone()
         } else {
             identity::resolve_identity(db, None, None, None, None, None, None).ok()
         };
@@ -40,13 +40,16 @@ impl Config {
 
     /// Get global config, initializing it from the current environment if needed.
     pub fn get() -> Config {
+        Self::with(Config::clone)
+    }
+
+    /// Read from the global config in place, initializing it if needed.
+    ///
+    /// Lets hot accessors like `paths::hcom_dir()` copy out a single field
+    /// instead of cloning the whole struct.
+    pub fn with<T>(f: impl FnOnce(&Config) -> T) -> T {
         let mut config = CONFIG.lock().unwrap_or_else(|e| e.into_inner());
-        if config.is_none() {
-            *config = Some(Self::from_env());
-        }
-        config
-            .clone()
-            .expect("Config should be initialized before returning")
+        f(config.get_or_insert_with(Self::from_env))
     }
 
     /// Reset global config (test-only).
@@ -1385,8 +1388,11 @@ impl MergedPreset {
     }
 }
 
-fn is_falsy(s: &str) -> bool {
-    matches!(s, "0" | "false" | "False" | "no" | "off" | "")
+/// Boolean config values that mean "off" (ASCII case-insensitive).
+const FALSY_VALUES: &[&str] = &["0", "false", "no", "off", ""];
+
+pub(crate) fn is_falsy(s: &str) -> bool {
+    FALSY_VALUES.iter().any(|f| s.eq_ignore_ascii_case(f))
 }
 
 /// Structured snapshot of config state for load/save operations.
@@ -2039,6 +2045,8 @@ mod tests {
         assert!(is_falsy("0"));
         assert!(is_falsy("false"));
         assert!(is_falsy("False"));
+        assert!(is_falsy("FALSE"));
+        assert!(is_falsy("Off"));
         assert!(is_falsy("no"));
         assert!(is_falsy("off"));
         assert!(is_falsy(""));
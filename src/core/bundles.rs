@@ -13,14 +13,15 @@ use crate::shared::{SenderIdentity, SenderKind};
 
 /// Parse comma-separated list into list of non-empty trimmed strings.
 pub fn parse_csv_list(raw: Option<&str>) -> Vec<String> {
-    match raw {
-        None => vec![],
-        Some(s) => s
-            .split(',')
-            .map(|p| p.trim().to_string())
-            .filter(|p| !p.is_empty())
-            .collect(),
-    }
+    let Some(s) = raw.filter(|s| !s.is_empty()) else {
+        return vec![];
+    };
+    // Trim and drop empties on borrowed slices; only kept items are allocated.
+    s.split(',')
+        .map(str::trim)
+        .filter(|p| !p.is_empty())
+        .map(str::to_string)
+        .collect()
 }
 
 /// Get bundle instance name from identity.
@@ -438,6 +439,12 @@ mod tests {
         assert_eq!(parse_csv_list(None), empty);
         assert_eq!(parse_csv_list(Some("")), empty);
         assert_eq!(parse_csv_list(Some(",,,")), empty);
+        assert_eq!(parse_csv_list(Some("   ")), empty);
+    }
+
+    #[test]
+    fn test_parse_csv_list_single() {
+        assert_eq!(parse_csv_list(Some(" 42 ")), vec!["42"]);
     }
 
     // ===== get_bundle_instance_name =====
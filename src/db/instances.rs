@@ -4,7 +4,7 @@ use anyhow::Result;
 use rusqlite::{OptionalExtension, params};
 
 use super::{HcomDb, chrono_now_iso, subscriptions};
-use crate::shared::constants::ST_LISTENING;
+use crate::shared::constants::{ST_ACTIVE, ST_LISTENING};
 use crate::shared::time::now_epoch_i64;
 
 /// Instance status info
@@ -725,6 +725,32 @@ impl HcomDb {
         Ok(rows)
     }
 
+    /// Newest-first instance rows that are active/listening or changed status
+    /// at or after `since`, excluding `exclude_name`, capped at `limit`.
+    ///
+    /// Filters in SQL so callers that only want a handful of live rows walk
+    /// `idx_created_at` and stop early instead of loading the whole table.
+    pub fn iter_live_instances_full(
+        &self,
+        exclude_name: &str,
+        since: f64,
+        limit: usize,
+    ) -> Result<Vec<InstanceRow>> {
+        let mut stmt = self.conn.prepare_cached(
+            "SELECT * FROM instances
+             WHERE name != ?1 AND (status IN (?2, ?3) OR status_time >= ?4)
+             ORDER BY created_at DESC LIMIT ?5",
+        )?;
+        let rows = stmt
+            .query_map(
+                params![exclude_name, ST_ACTIVE, ST_LISTENING, since, limit as i64],
+                InstanceRow::from_row,
+            )?
+            .filter_map(|r| r.ok())
+            .collect();
+        Ok(rows)
+    }
+
     /// Save (INSERT OR REPLACE) an instance row.
     /// Uses a JSON Value map for flexible field specification.
     pub fn save_instance_named(
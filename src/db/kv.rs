@@ -18,9 +18,9 @@ impl HcomDb {
     pub fn kv_get(&self, key: &str) -> Result<Option<String>> {
         match self
             .conn
-            .query_row("SELECT value FROM kv WHERE key = ?", params![key], |row| {
-                row.get::<_, Option<String>>(0)
-            }) {
+            .prepare_cached("SELECT value FROM kv WHERE key = ?")?
+            .query_row(params![key], |row| row.get::<_, Option<String>>(0))
+        {
             Ok(val) => Ok(val),
             Err(rusqlite::Error::QueryReturnedNoRows) => Ok(None),
             Err(e) => Err(e.into()),
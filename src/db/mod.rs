@@ -37,8 +37,17 @@ pub use instances::InstanceRow;
 pub use instances::InstanceStatus;
 
 /// Schema version - bump on any schema change.
-const SCHEMA_VERSION: i32 = 18;
+const SCHEMA_VERSION: i32 = 19;
 pub const DEV_ROOT_KV_KEY: &str = "config:dev_root";
+/// Tables a current-schema DB must have; checked on every open.
+const REQUIRED_TABLES: &[&str] = &[
+    "events",
+    "instances",
+    "kv",
+    "notify_endpoints",
+    "session_bindings",
+    "claude_actor_capabilities",
+];
 const MIGRATIONS: &[(i32, &str)] = &[
     (
         17,
@@ -67,6 +76,11 @@ const MIGRATIONS: &[(i32, &str)] = &[
          CREATE INDEX IF NOT EXISTS idx_claude_actor_session
              ON claude_actor_capabilities(session_id);",
     ),
+    (
+        19,
+        "CREATE INDEX IF NOT EXISTS idx_events_bundle_id
+             ON events(json_extract(data, '$.bundle_id')) WHERE type = 'bundle';",
+    ),
 ];
 
 /// Schema compatibility check result
@@ -364,6 +378,7 @@ impl HcomDb {
             CREATE INDEX IF NOT EXISTS idx_type ON events(type);
             CREATE INDEX IF NOT EXISTS idx_instance ON events(instance);
             CREATE INDEX IF NOT EXISTS idx_type_instance ON events(type, instance);
+            CREATE INDEX IF NOT EXISTS idx_events_bundle_id ON events(json_extract(data, '$.bundle_id')) WHERE type = 'bundle';
 
             -- Instance indexes
             CREATE INDEX IF NOT EXISTS idx_session_id ON instances(session_id);
@@ -529,20 +544,9 @@ impl HcomDb {
             .filter_map(|r| r.ok())
             .collect();
 
-        let required: std::collections::HashSet<&str> = [
-            "events",
-            "instances",
-            "kv",
-            "notify_endpoints",
-            "session_bindings",
-            "claude_actor_capabilities",
-        ]
-        .into_iter()
-        .collect();
-
         if version == 0 {
             // Race handling: another process may be initializing
-            if !tables.is_empty() && required.iter().any(|t| tables.contains(*t)) {
+            if !tables.is_empty() && REQUIRED_TABLES.iter().any(|t| tables.contains(*t)) {
                 let mut resolved_version = 0i32;
                 for _ in 0..20 {
                     let v2: i32 = self
@@ -586,7 +590,7 @@ impl HcomDb {
                 return Ok(SchemaCompat::Ok);
             }
             // Pre-versioned DB with our tables - needs archive
-            if required.iter().any(|t| tables.contains(*t)) {
+            if REQUIRED_TABLES.iter().any(|t| tables.contains(*t)) {
                 return Ok(SchemaCompat::NeedsArchive(
                     "Pre-versioned DB found".to_string(),
                     None,
@@ -620,9 +624,12 @@ impl HcomDb {
         }
 
         // Verify required tables exist
-        let have_all = required.iter().all(|t| tables.contains(*t));
+        let have_all = REQUIRED_TABLES.iter().all(|t| tables.contains(*t));
         if !have_all {
-            let missing: Vec<&&str> = required.iter().filter(|t| !tables.contains(**t)).collect();
+            let missing: Vec<&&str> = REQUIRED_TABLES
+                .iter()
+                .filter(|t| !tables.contains(**t))
+                .collect();
             return Ok(SchemaCompat::NeedsArchive(
                 format!("DB missing tables {:?}", missing),
                 None,
@@ -1506,6 +1513,16 @@ pub(super) mod tests {
             .unwrap();
         assert_eq!(last_seen, 123);
 
+        let has_bundle_index: bool = db
+            .conn
+            .query_row(
+                "SELECT EXISTS(SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_events_bundle_id')",
+                [],
+                |row| row.get(0),
+            )
+            .unwrap();
+        assert!(has_bundle_index);
+
         cleanup_test_db(db_path);
     }
 
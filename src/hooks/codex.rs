@@ -540,6 +540,11 @@ pub fn dispatch_codex_hook_native(hook_name: &str) -> i32 {
         }
     };
 
+    let ctx = HcomContext::from_os();
+    if !common::hook_gate_precheck(&ctx) {
+        return 0;
+    }
+
     let db = match HcomDb::open() {
         Ok(db) => db,
         Err(e) => {
@@ -552,7 +557,6 @@ pub fn dispatch_codex_hook_native(hook_name: &str) -> i32 {
         }
     };
 
-    let ctx = HcomContext::from_os();
     if !common::hook_gate_check(&ctx, &db) {
         return 0;
     }
@@ -72,6 +72,16 @@ pub(crate) const SAFE_HCOM_COMMANDS: &[&str] = &[
     "--new-terminal",
 ];
 
+/// DB-free pre-gate, run before `HcomDb::open`.
+///
+/// A hook hcom did not launch, with no database file on disk (fresh install,
+/// or right after `hcom reset` archived it), has no participants to serve.
+/// Returning false lets it exit without opening — and thereby creating — the
+/// database. True means the full `hook_gate_check` still has to run.
+pub fn hook_gate_precheck(ctx: &HcomContext) -> bool {
+    ctx.process_id.is_some() || ctx.is_launched || crate::paths::db_path().exists()
+}
+
 /// Pre-gate check: should hooks proceed?
 ///
 ///
@@ -1884,6 +1894,29 @@ mod tests {
         crate::shared::context::HcomContext::from_env(&env, cwd.to_path_buf())
     }
 
+    #[test]
+    #[serial]
+    fn hook_gate_precheck_skips_non_launched_hooks_without_db() {
+        let (_dir, hcom_dir, _home, _guard) = isolated_test_env();
+        let ctx = context_with_process_id(&hcom_dir, None);
+        assert!(
+            !hook_gate_precheck(&ctx),
+            "no DB file means no participants"
+        );
+
+        let launched = context_with_process_id(&hcom_dir, Some("pid-1"));
+        assert!(
+            hook_gate_precheck(&launched),
+            "launched hooks always proceed"
+        );
+
+        HcomDb::open().unwrap();
+        assert!(
+            hook_gate_precheck(&ctx),
+            "existing DB defers to hook_gate_check"
+        );
+    }
+
     #[test]
     fn transcript_lineage_uses_structured_fork_ancestry() {
         let (dir, db) = make_test_db();
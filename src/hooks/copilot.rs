@@ -522,6 +522,10 @@ pub fn dispatch_copilot_hook_native(hook_name: &str) -> i32 {
             return 0;
         }
     };
+    let ctx = HcomContext::from_os();
+    if !common::hook_gate_precheck(&ctx) {
+        return 0;
+    }
     let db = match HcomDb::open() {
         Ok(db) => db,
         Err(err) => {
@@ -533,7 +537,6 @@ pub fn dispatch_copilot_hook_native(hook_name: &str) -> i32 {
             return 0;
         }
     };
-    let ctx = HcomContext::from_os();
     if !common::hook_gate_check(&ctx, &db) {
         return 0;
     }
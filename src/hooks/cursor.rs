@@ -638,6 +638,10 @@ pub fn dispatch_cursor_hook_native(hook_name: &str) -> i32 {
             return 0;
         }
     };
+    let ctx = HcomContext::from_os();
+    if !common::hook_gate_precheck(&ctx) {
+        return 0;
+    }
     let db = match HcomDb::open() {
         Ok(db) => db,
         Err(err) => {
@@ -649,7 +653,6 @@ pub fn dispatch_cursor_hook_native(hook_name: &str) -> i32 {
             return 0;
         }
     };
-    let ctx = HcomContext::from_os();
     if !common::hook_gate_check(&ctx, &db) {
         return 0;
     }
@@ -840,20 +840,8 @@ pub fn dispatch_gemini_hook(hook_name: &str) -> i32 {
         HookPayload::from_gemini(stdin_json)
     };
 
-    // Pre-gate: skip BeforeAgent for non-participants
-    if !ctx.is_launched && hook_name == "gemini-beforeagent" {
-        let sid = match payload.session_id.as_deref() {
-            Some(sid) => sid,
-            None => return 0,
-        };
-        // Quick DB check for session binding
-        if let Ok(db) = HcomDb::open() {
-            if db.get_session_binding(sid).ok().flatten().is_none() {
-                return 0;
-            }
-        } else {
-            return 0;
-        }
+    if !common::hook_gate_precheck(&ctx) {
+        return 0;
     }
 
     // Ensure hcom directories exist
@@ -872,6 +860,18 @@ pub fn dispatch_gemini_hook(hook_name: &str) -> i32 {
         }
     };
 
+    // Pre-gate: skip BeforeAgent for non-participants (no session, or session not
+    // bound). Reuses the dispatch connection instead of opening a second one.
+    if !ctx.is_launched
+        && hook_name == "gemini-beforeagent"
+        && payload
+            .session_id
+            .as_deref()
+            .is_none_or(|sid| db.get_session_binding(sid).ok().flatten().is_none())
+    {
+        return 0;
+    }
+
     // Pre-gate: non-participants with empty DB → exit 0, no output
     if !common::hook_gate_check(&ctx, &db) {
         return 0;
@@ -779,19 +779,8 @@ pub fn dispatch_kimi_hook(hook_name: &str) -> i32 {
 
     let payload = HookPayload::from_kimi(hook_name, raw);
 
-    // Pre-gate: skip UserPromptSubmit for non-participants
-    if !ctx.is_launched && hook_name == "kimi-userpromptsubmit" {
-        let sid = match payload.session_id.as_deref() {
-            Some(sid) => sid,
-            None => return 0,
-        };
-        if let Ok(db) = HcomDb::open() {
-            if db.get_session_binding(sid).ok().flatten().is_none() {
-                return 0;
-            }
-        } else {
-            return 0;
-        }
+    if !common::hook_gate_precheck(&ctx) {
+        return 0;
     }
 
     if !crate::paths::ensure_hcom_directories() {
@@ -806,6 +795,18 @@ pub fn dispatch_kimi_hook(hook_name: &str) -> i32 {
         }
     };
 
+    // Pre-gate: skip UserPromptSubmit for non-participants (no session, or session not
+    // bound). Reuses the dispatch connection instead of opening a second one.
+    if !ctx.is_launched
+        && hook_name == "kimi-userpromptsubmit"
+        && payload
+            .session_id
+            .as_deref()
+            .is_none_or(|sid| db.get_session_binding(sid).ok().flatten().is_none())
+    {
+        return 0;
+    }
+
     if !common::hook_gate_check(&ctx, &db) {
         return 0;
     }
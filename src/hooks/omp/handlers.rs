@@ -304,6 +304,9 @@ pub(crate) fn handle_stop(db: &HcomDb, argv: &[String]) -> (i32, String) {
 pub fn dispatch_omp_hook(hook_name: &str, argv: &[String]) -> (i32, String) {
     let start = Instant::now();
     let ctx = HcomContext::from_os();
+    if !common::hook_gate_precheck(&ctx) {
+        return (0, String::new());
+    }
     crate::paths::ensure_hcom_directories_at(&ctx.hcom_dir);
     let db = match HcomDb::open() {
         Ok(db) => db,
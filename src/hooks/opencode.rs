@@ -475,6 +475,9 @@ pub fn dispatch_opencode_hook(hook_name: &str, argv: &[String]) -> (i32, String)
 
     // Build context
     let ctx = HcomContext::from_os();
+    if !common::hook_gate_precheck(&ctx) {
+        return (0, String::new());
+    }
 
     // Ensure hcom directories exist before opening DB.
     // On clean HOME/HCOM_DIR the DB parent dir won't exist yet.
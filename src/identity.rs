@@ -294,7 +294,7 @@ fn resolve_identity_with_expectation(
     session_id: Option<&str>,
     process_id: Option<&str>,
     codex_thread_id: Option<&str>,
-    identity_expected: bool,
+    identity_expected: impl FnOnce() -> bool,
     transcript_fallback: Option<&dyn Fn(&HcomDb) -> Option<SenderIdentity>>,
 ) -> Result<SenderIdentity, HcomError> {
     // 1. System sender (internal use)
@@ -438,7 +438,7 @@ fn resolve_identity_with_expectation(
                 }
             }
             None => {
-                if identity_expected {
+                if identity_expected() {
                     crate::log::log_warn(
                         "identity",
                         "resolve.process_binding_expired",
@@ -460,7 +460,7 @@ fn resolve_identity_with_expectation(
     }
 
     // 6. No identity
-    if identity_expected {
+    if identity_expected() {
         crate::log::log_warn(
             "identity",
             "resolve.no_identity",
@@ -494,7 +494,9 @@ pub fn resolve_identity(
         session_id,
         process_id,
         codex_thread_id,
-        crate::shared::is_inside_ai_tool(),
+        // Only consulted when choosing whether to log a miss; tool detection
+        // snapshots the whole environment, so defer it to that point.
+        crate::shared::is_inside_ai_tool,
         transcript_fallback,
     )
 }
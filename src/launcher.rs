@@ -199,6 +199,8 @@ pub struct LaunchParams {
     pub skip_validation: bool,
     pub terminal: Option<String>,
     pub append_reply_handoff: bool,
+    /// Config the caller already loaded; `launch` reads config.toml itself when None.
+    pub hcom_config: Option<HcomConfig>,
 }
 
 impl Default for LaunchParams {
@@ -222,6 +224,7 @@ impl Default for LaunchParams {
             skip_validation: false,
             terminal: None,
             append_reply_handoff: true,
+            hcom_config: None,
         }
     }
 }
@@ -1693,11 +1696,13 @@ pub fn launch(db: &HcomDb, mut params: LaunchParams) -> Result<LaunchResult> {
 
     // Load config before hook setup so auto_approve is authoritative for
     // wrapped launches as well as manual `hcom hooks add`.
-    let hcom_config = HcomConfig::load(None).unwrap_or_else(|e| {
-        eprintln!("[hcom] warn: config load failed, using defaults: {e}");
-        let mut c = HcomConfig::default();
-        c.normalize();
-        c
+    let hcom_config = params.hcom_config.take().unwrap_or_else(|| {
+        HcomConfig::load(None).unwrap_or_else(|e| {
+            eprintln!("[hcom] warn: config load failed, using defaults: {e}");
+            let mut c = HcomConfig::default();
+            c.normalize();
+            c
+        })
     });
 
     // For Codex: probe CODEX_HOME writability synchronously. Sandboxed parent
@@ -165,7 +165,7 @@ pub fn protected_hcom_dir_component(path: &Path) -> Option<&'static str> {
 ///
 /// Uses centralized Config (HCOM_DIR env var or ~/.hcom fallback).
 pub fn hcom_dir() -> PathBuf {
-    Config::get().hcom_dir
+    Config::with(|c| c.hcom_dir.clone())
 }
 
 /// Build path under hcom directory, optionally ensuring parent exists.
@@ -4,14 +4,30 @@
 //! Used by `hcom relay new` to find and pin the fastest public broker.
 
 use std::net::{TcpStream, ToSocketAddrs};
-use std::sync::Arc;
+use std::sync::{Arc, LazyLock};
 use std::time::{Duration, Instant};
 
 /// Result of testing a single broker: (host, port, ping_ms or None on failure).
 pub type BrokerTestResult = (String, u16, Option<u64>);
 
+/// Client config shared by every probe in the process: the webpki root store is
+/// built once, and rustls' in-memory session cache lets a repeat handshake to
+/// the same broker resume instead of redoing the full exchange.
+static PING_TLS_CONFIG: LazyLock<Arc<rustls::ClientConfig>> = LazyLock::new(|| {
+    let mut root_store = rustls::RootCertStore::empty();
+    root_store.extend(webpki_roots::TLS_SERVER_ROOTS.iter().cloned());
+    Arc::new(
+        rustls::ClientConfig::builder()
+            .with_root_certificates(root_store)
+            .with_no_client_auth(),
+    )
+});
+
 /// Test a single broker via TCP+TLS handshake. Returns round-trip ms or None.
 pub fn ping_broker(host: &str, port: u16, use_tls: bool) -> Option<u64> {
+    // Resolve the shared config before the clock starts so the first probe
+    // doesn't bill root-store construction as network latency.
+    let tls_config = use_tls.then(|| Arc::clone(&PING_TLS_CONFIG));
     let t0 = Instant::now();
     let socket_addr = format!("{}:{}", host, port)
         .to_socket_addrs()
@@ -19,7 +35,7 @@ pub fn ping_broker(host: &str, port: u16, use_tls: bool) -> Option<u64> {
         .next()?;
     let mut stream = TcpStream::connect_timeout(&socket_addr, Duration::from_secs(5)).ok()?;
 
-    if use_tls {
+    if let Some(tls_config) = tls_config {
         // TCP+TLS handshake only. Verify the broker is reachable and accepts TLS.
         // Set timeouts so handshake doesn't block forever on unreachable brokers.
         stream.set_read_timeout(Some(Duration::from_secs(5))).ok()?;
@@ -27,14 +43,9 @@ pub fn ping_broker(host: &str, port: u16, use_tls: bool) -> Option<u64> {
             .set_write_timeout(Some(Duration::from_secs(5)))
             .ok()?;
 
-        let mut root_store = rustls::RootCertStore::empty();
-        root_store.extend(webpki_roots::TLS_SERVER_ROOTS.iter().cloned());
-        let config = rustls::ClientConfig::builder()
-            .with_root_certificates(root_store)
-            .with_no_client_auth();
         let server_name: rustls::pki_types::ServerName<'static> =
             host.to_string().try_into().ok()?;
-        let mut conn = rustls::ClientConnection::new(Arc::new(config), server_name).ok()?;
+        let mut conn = rustls::ClientConnection::new(tls_config, server_name).ok()?;
 
         // Drive TLS handshake via complete_io (handles read/write round-trips).
         // Stops after handshake — the read timeout prevents blocking on post-handshake
@@ -55,7 +66,8 @@ pub fn ping_broker(host: &str, port: u16, use_tls: bool) -> Option<u64> {
 }
 
 /// Test all brokers in parallel. Returns results in input order.
-/// Uses std::thread::scope for scoped threads (no Arc needed for shared refs).
+/// Uses std::thread::scope for scoped threads, so each probe borrows its host
+/// straight from `brokers` (no Arc or per-thread String copy needed).
 pub fn test_brokers_parallel(brokers: &[(&str, u16)]) -> Vec<BrokerTestResult> {
     let mut results: Vec<BrokerTestResult> = brokers
         .iter()
@@ -66,13 +78,10 @@ pub fn test_brokers_parallel(brokers: &[(&str, u16)]) -> Vec<BrokerTestResult> {
         let handles: Vec<_> = brokers
             .iter()
             .enumerate()
-            .map(|(i, (host, port))| {
-                let host = host.to_string();
-                let port = *port;
+            .map(|(i, &(host, port))| {
                 s.spawn(move || {
                     let use_tls = port == 8883 || port == 8886;
-                    let ping_ms = ping_broker(&host, port, use_tls);
-                    (i, ping_ms)
+                    (i, ping_broker(host, port, use_tls))
                 })
             })
             .collect();
@@ -10,7 +10,7 @@ use rumqttc::v5::mqttbytes::v5::Packet;
 use rumqttc::v5::{Client, Connection, Event, MqttOptions};
 use rustls::RootCertStore;
 use rustls_native_certs::load_native_certs;
-use std::sync::{Arc, Condvar, Mutex, mpsc};
+use std::sync::{Arc, Condvar, LazyLock, Mutex, mpsc};
 use std::thread;
 use std::time::{Duration, Instant};
 
@@ -25,10 +25,20 @@ use super::{
     state_topic, wildcard_topic,
 };
 
+/// Process-wide relay TLS client config. Built on first use so long-lived
+/// callers (TUI remote actions, repeated ephemeral publishes) load the native
+/// cert store once and share rustls' session cache across connections.
+static RELAY_TLS_CONFIG: LazyLock<Arc<rustls::ClientConfig>> =
+    LazyLock::new(build_relay_tls_config);
+
+fn relay_tls_config() -> TlsConfiguration {
+    TlsConfiguration::Rustls(Arc::clone(&RELAY_TLS_CONFIG))
+}
+
 /// Build a TLS config that combines webpki-roots (bundled Mozilla CAs for Android/Termux
 /// compatibility) with native system certs (for private broker support).
 /// This ensures public brokers work everywhere while preserving user-installed CA support.
-fn relay_tls_config() -> TlsConfiguration {
+fn build_relay_tls_config() -> Arc<rustls::ClientConfig> {
     let mut root_store = RootCertStore::empty();
 
     // Add webpki-roots as the base — fixes Android/Termux where rustls-native-certs fails
@@ -54,7 +64,7 @@ fn relay_tls_config() -> TlsConfiguration {
         .with_root_certificates(root_store)
         .with_no_client_auth();
 
-    TlsConfiguration::Rustls(Arc::new(tls_config))
+    Arc::new(tls_config)
 }
 
 /// Commands sent from the main thread to the relay event loop.
@@ -794,6 +794,7 @@ fn handle_remote_launch(
             skip_validation: false,
             terminal: request.terminal,
             append_reply_handoff: false,
+            hcom_config: None,
         },
     )
     .map_err(|e| e.to_string())?;
@@ -543,11 +543,6 @@ pub fn derive_relay_health(obs: &RelayObservation) -> RelayHealth {
     }
 }
 
-/// Convenience wrapper for callers that just want the answer.
-pub fn relay_health(config: &HcomConfig, db: &HcomDb) -> RelayHealth {
-    derive_relay_health(&observe_relay(config, db))
-}
-
 /// Runtime-health KV keys cleared on relay disable. Deliberately excludes
 /// activity/watermark keys (`relay_last_push`, `relay_last_push_id`,
 /// `relay_last_sync`) — those are correctness invariants for re-enable in the
@@ -44,16 +44,12 @@ pub fn encode_join_token(
     }
 
     // Plaintext path: try public broker first → v0x01, fall back to v0x02.
-    for (i, (host, port)) in DEFAULT_BROKERS.iter().enumerate() {
-        let mqtts = format!("mqtts://{}:{}", host, port);
-        let mqtt = format!("mqtt://{}:{}", host, port);
-        if broker_url == mqtts || broker_url == mqtt {
-            let mut buf = Vec::with_capacity(18);
-            buf.push(0x01);
-            buf.extend_from_slice(&uuid_bytes);
-            buf.push(i as u8);
-            return Some(URL_SAFE_NO_PAD.encode(&buf));
-        }
+    if let Some(i) = public_broker_index(broker_url) {
+        let mut buf = [0u8; 18];
+        buf[0] = 0x01;
+        buf[1..17].copy_from_slice(&uuid_bytes);
+        buf[17] = i;
+        return Some(URL_SAFE_NO_PAD.encode(buf));
     }
 
     let mut buf = Vec::with_capacity(17 + broker_url.len());
@@ -65,17 +61,13 @@ pub fn encode_join_token(
 
 fn encode_v04(uuid_bytes: &[u8; 16], broker_url: &str, psk: &[u8; PSK_LEN]) -> String {
     // Public broker → 1+16+32+1 = 50 bytes; private broker → variable.
-    for (i, (host, port)) in DEFAULT_BROKERS.iter().enumerate() {
-        let mqtts = format!("mqtts://{}:{}", host, port);
-        let mqtt = format!("mqtt://{}:{}", host, port);
-        if broker_url == mqtts || broker_url == mqtt {
-            let mut buf = Vec::with_capacity(1 + 16 + PSK_LEN + 1);
-            buf.push(0x04);
-            buf.extend_from_slice(uuid_bytes);
-            buf.extend_from_slice(psk);
-            buf.push(i as u8);
-            return URL_SAFE_NO_PAD.encode(&buf);
-        }
+    if let Some(i) = public_broker_index(broker_url) {
+        let mut buf = [0u8; 1 + 16 + PSK_LEN + 1];
+        buf[0] = 0x04;
+        buf[1..17].copy_from_slice(uuid_bytes);
+        buf[17..17 + PSK_LEN].copy_from_slice(psk);
+        buf[17 + PSK_LEN] = i;
+        return URL_SAFE_NO_PAD.encode(buf);
     }
 
     let mut buf = Vec::with_capacity(1 + 16 + PSK_LEN + broker_url.len());
@@ -86,14 +78,29 @@ fn encode_v04(uuid_bytes: &[u8; 16], broker_url: &str, psk: &[u8; PSK_LEN]) -> S
     URL_SAFE_NO_PAD.encode(&buf)
 }
 
+/// Index of `broker_url` in DEFAULT_BROKERS if it names a public broker over
+/// `mqtts://` or `mqtt://`. Splits and parses the address once instead of
+/// formatting both URL forms for every candidate.
+pub(crate) fn public_broker_index(broker_url: &str) -> Option<u8> {
+    let addr = broker_url
+        .strip_prefix("mqtts://")
+        .or_else(|| broker_url.strip_prefix("mqtt://"))?;
+    let (host, port) = addr.rsplit_once(':')?;
+    // Only the canonical decimal form, as the URL would be formatted.
+    if port.starts_with('0') || !port.bytes().all(|b| b.is_ascii_digit()) {
+        return None;
+    }
+    let port = port.parse::<u16>().ok()?;
+    DEFAULT_BROKERS
+        .iter()
+        .position(|&candidate| candidate == (host, port))
+        .map(|i| i as u8)
+}
+
 /// Decode a join token. Returns `None` if the token is unparseable.
 pub fn decode_join_token(token: &str) -> Option<DecodedToken> {
-    let padded = match token.len() % 4 {
-        2 => format!("{}==", token),
-        3 => format!("{}=", token),
-        _ => token.to_string(),
-    };
-    let raw = URL_SAFE_NO_PAD.decode(padded.trim_end_matches('=')).ok()?;
+    // Tokens are minted unpadded; tolerate pasted padding by stripping it.
+    let raw = URL_SAFE_NO_PAD.decode(token.trim_end_matches('=')).ok()?;
 
     if raw.len() < 17 {
         return None;
@@ -210,6 +217,24 @@ mod tests {
         assert_eq!(uuid, back);
     }
 
+    #[test]
+    fn test_public_broker_index() {
+        assert_eq!(public_broker_index("mqtts://broker.emqx.io:8883"), Some(0));
+        assert_eq!(
+            public_broker_index("mqtt://test.mosquitto.org:8886"),
+            Some(2)
+        );
+        assert_eq!(public_broker_index("mqtts://broker.emqx.io:1883"), None);
+        assert_eq!(
+            public_broker_index("mqtts://broker.emqx.io.evil:8883"),
+            None
+        );
+        assert_eq!(public_broker_index("broker.emqx.io:8883"), None);
+        assert_eq!(public_broker_index("mqtts://broker.emqx.io:08883"), None);
+        assert_eq!(public_broker_index("mqtts://broker.emqx.io:+8883"), None);
+        assert_eq!(public_broker_index("mqtts://broker.emqx.io"), None);
+    }
+
     #[test]
     fn test_uuid_to_bytes_invalid() {
         assert!(uuid_to_bytes("not-a-uuid").is_none());
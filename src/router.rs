@@ -226,17 +226,16 @@ fn extract_global_flags_manual(argv: &[String]) -> (Vec<String>, GlobalFlags) {
 ///
 /// Also detects --help/-h requests (before `--`) for per-command help dispatch.
 pub fn extract_global_flags_full(argv: &[String]) -> (Vec<String>, GlobalFlags, bool) {
-    let sep_pos = argv.iter().position(|a| a == "--");
-    let scan_end = sep_pos.unwrap_or(argv.len());
-
     let mut remaining = Vec::with_capacity(argv.len());
     let mut flags = GlobalFlags::default();
     let mut help_requested = false;
     let mut i = 0;
 
-    while i < scan_end {
+    // Single pass: stop at the first `--` instead of locating it up front.
+    while i < argv.len() {
         match argv[i].as_str() {
-            "--name" if i + 1 < scan_end => {
+            "--" => break,
+            "--name" if argv.get(i + 1).is_some_and(|v| v != "--") => {
                 flags.name = Some(argv[i + 1].clone());
                 i += 2;
             }
@@ -296,8 +295,16 @@ pub fn resolve_action(argv: &[String]) -> Action {
         };
     }
 
-    // Strip global flags for command/hook detection
-    let (stripped, _flags) = extract_global_flags(argv);
+    // Strip global flags for command/hook detection. A leading positional
+    // starts clap's trailing var-arg, so the parse would return argv as-is;
+    // skip building the parser in that (common, hook-path) case.
+    let parsed;
+    let stripped: &[String] = if first.starts_with('-') {
+        parsed = extract_global_flags(argv).0;
+        &parsed
+    } else {
+        argv
+    };
 
     // Find the first non-flag token in stripped args
     let cmd_token = stripped.first().map(|s| s.as_str()).unwrap_or("");
@@ -352,12 +359,20 @@ pub fn resolve_action(argv: &[String]) -> Action {
 /// that worktree's binary.
 /// so worktree development works: `HCOM_DEV_ROOT=/path/to/worktree hcom list`
 /// will run the worktree's hcom binary instead of the installed one.
-pub fn maybe_reexec_dev_root() {
+///
+/// Skipped for `config dev_root` so a stale pointer can't trap the user, and
+/// for `update`, which must run from the invoked (installed) binary. Those argv
+/// scans only run once a dev root is actually configured.
+pub fn maybe_reexec_dev_root(argv: &[String]) {
     let (dev_root, source) = match resolve_effective_dev_root(&crate::paths::db_path()) {
         Some(v) => v,
         None => return,
     };
 
+    if is_config_dev_root_invocation(argv) || is_update_invocation(argv) {
+        return;
+    }
+
     // Find current binary's location
     let current_exe = match env::current_exe() {
         Ok(p) => p,
@@ -443,9 +458,11 @@ fn read_dev_root_from_kv(db_path: &Path) -> Option<PathBuf> {
     // A missing db file or unset `dev_root` key are normal states (fresh HCOM_DIR,
     // user never ran `hcom config dev_root`). Only warn on unexpected failures
     // like permission denied or corruption.
+    // Read-only and single-threaded: this probe runs on every invocation and
+    // never writes, so skip the create/read-write open and SQLite's mutexes.
     let conn = match rusqlite::Connection::open_with_flags(
         db_path,
-        rusqlite::OpenFlags::SQLITE_OPEN_READ_ONLY,
+        rusqlite::OpenFlags::SQLITE_OPEN_READ_ONLY | rusqlite::OpenFlags::SQLITE_OPEN_NO_MUTEX,
     ) {
         Ok(c) => c,
         Err(e) => {
@@ -485,7 +502,14 @@ fn read_dev_root_from_kv(db_path: &Path) -> Option<PathBuf> {
 }
 
 /// Check if two paths refer to the same file (follows symlinks).
+///
+/// Runs on every invocation while a dev root is configured, so identical
+/// paths (the usual case once re-exec has happened) skip both canonicalize
+/// calls and cost a single stat.
 fn is_same_file(a: &Path, b: &Path) -> bool {
+    if a == b {
+        return a.exists();
+    }
     match (std::fs::canonicalize(a), std::fs::canonicalize(b)) {
         (Ok(ca), Ok(cb)) => ca == cb,
         _ => false,
@@ -499,12 +523,7 @@ pub fn dispatch() -> anyhow::Result<()> {
     let args: Vec<String> = env::args().collect();
     let argv = &args[1..]; // strip binary name
 
-    // Skip dev_root re-exec for `config dev_root` so a stale pointer can't
-    // trap the user. Also keep `update` on the invoked (installed) binary;
-    // otherwise the checkout's version and path would drive update decisions.
-    if !is_config_dev_root_invocation(argv) && !is_update_invocation(argv) {
-        maybe_reexec_dev_root();
-    }
+    maybe_reexec_dev_root(argv);
 
     let action = resolve_action(argv);
 
@@ -589,27 +608,9 @@ pub fn dispatch() -> anyhow::Result<()> {
                 std::process::exit(exit_code);
             }
         }
-        Action::Command { ref cmd, ref args }
-            if matches!(
-                cmd.as_str(),
-                "send"
-                    | "list"
-                    | "stop"
-                    | "listen"
-                    | "events"
-                    | "transcript"
-                    | "config"
-                    | "status"
-                    | "bundle"
-                    | "archive"
-                    | "reset"
-                    | "hooks"
-                    | "term"
-                    | "relay"
-                    | "run"
-                    | "update"
-            ) =>
-        {
+        // Every other known command goes through the shared native dispatcher.
+        // Guarding on `COMMANDS` keeps this arm and `resolve_action` in sync.
+        Action::Command { ref cmd, ref args } if is_command(cmd) => {
             let exit_code = dispatch_native_command(cmd, args);
             if exit_code != 0 {
                 std::process::exit(exit_code);
@@ -713,7 +714,10 @@ fn dispatch_native_command(cmd: &str, args: &[String]) -> i32 {
     // Strip command name from stripped args to get command-specific argv.
     // For "run", re-inject --help so the script itself can handle it.
     let cmd_argv: Vec<String> = {
-        let mut v: Vec<String> = stripped.iter().skip(1).cloned().collect();
+        let mut v = stripped;
+        if !v.is_empty() {
+            v.remove(0);
+        }
         if cmd == "run" && help_requested {
             v.push("--help".to_string());
         }
@@ -741,8 +745,18 @@ fn dispatch_native_command(cmd: &str, args: &[String]) -> i32 {
     let codex_thread_id = std::env::var("CODEX_THREAD_ID")
         .ok()
         .filter(|s| !s.is_empty());
-    let has_from_flag = cmd_argv.iter().any(|a| a == "--from" || a == "-b");
-    let is_inside_ai = crate::shared::is_inside_ai_tool();
+    // One pass over the command argv for every flag the dispatcher inspects.
+    let (mut has_from_flag, mut has_json, mut had_separator) = (false, false, false);
+    for arg in &cmd_argv {
+        match arg.as_str() {
+            "--from" | "-b" => has_from_flag = true,
+            "--json" => has_json = true,
+            "--" => had_separator = true,
+            _ => {}
+        }
+    }
+    // Tool detection snapshots the whole environment; only error paths need it.
+    let is_inside_ai = std::cell::LazyCell::new(crate::shared::is_inside_ai_tool);
     let ctx = match build_ctx_for_command(
         &db,
         Some(cmd),
@@ -758,7 +772,7 @@ fn dispatch_native_command(cmd: &str, args: &[String]) -> i32 {
                 flags.name.as_deref(),
                 has_from_flag,
                 process_id.as_deref(),
-                is_inside_ai,
+                *is_inside_ai,
                 &e,
             )
             .unwrap_or_else(|| e.to_string());
@@ -768,7 +782,8 @@ fn dispatch_native_command(cmd: &str, args: &[String]) -> i32 {
     };
 
     // Identity gating: block unregistered sessions from gated commands
-    if let Err(e) = crate::cli_context::check_identity_gate(cmd, &ctx, has_from_flag, is_inside_ai)
+    if let Err(e) =
+        crate::cli_context::check_identity_gate(cmd, &ctx, has_from_flag, || *is_inside_ai)
     {
         eprintln!("Error: {e}");
         return 1;
@@ -778,7 +793,6 @@ fn dispatch_native_command(cmd: &str, args: &[String]) -> i32 {
     crate::cli_context::set_hookless_command_status(&db, cmd, &ctx);
 
     // Dispatch to command handler
-    let has_json = cmd_argv.iter().any(|a| a == "--json");
     /// Parse a clap Args struct from command argv, handling help/error output.
     /// Returns exit code on parse error (1 for errors, 0 for help/version).
     macro_rules! clap_parse {
@@ -804,7 +818,7 @@ fn dispatch_native_command(cmd: &str, args: &[String]) -> i32 {
         // Messaging
         "send" => match clap_parse!(crate::commands::send::SendArgs, cmd, &cmd_argv) {
             Ok(mut args) => {
-                args.had_separator = cmd_argv.iter().any(|a| a == "--");
+                args.had_separator = had_separator;
                 crate::commands::send::cmd_send(&db, &args, Some(&ctx))
             }
             Err(e) => {
@@ -1333,6 +1347,13 @@ mod tests {
         }
     }
 
+    #[test]
+    fn leading_positional_leaves_argv_unstripped() {
+        // resolve_action skips the clap parse when argv[0] is not a flag.
+        let argv = sv(&["send", "--name", "foo", "--go", "@luna"]);
+        assert_eq!(extract_global_flags(&argv).0, argv);
+    }
+
     #[test]
     fn send_not_found_gets_external_sender_hint_outside_ai() {
         let err = HcomError::NotFound(
@@ -1416,5 +1437,7 @@ mod tests {
         let _ = std::fs::write(&tmp, "test");
         assert!(is_same_file(&tmp, &tmp));
         let _ = std::fs::remove_file(&tmp);
+        // Identical but missing paths don't count as the same file
+        assert!(!is_same_file(&tmp, &tmp));
     }
 }
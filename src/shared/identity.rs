@@ -55,6 +55,9 @@ pub struct CommandContext {
     /// Raw `--name` value (if provided).
     pub explicit_name: Option<String>,
     /// Resolved instance identity (best-effort; may be None).
+    ///
+    /// Resolution already used --name, HCOM_PROCESS_ID and CODEX_THREAD_ID,
+    /// so None here is final — commands should not resolve again.
     pub identity: Option<SenderIdentity>,
     /// Whether --go flag was provided.
     pub go: bool,
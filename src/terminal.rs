@@ -12,6 +12,7 @@ use std::fs;
 use std::io::Write;
 use std::path::{Path, PathBuf};
 use std::process::Command;
+use std::sync::LazyLock;
 use std::time::{Duration, Instant};
 
 use anyhow::{Context, Result, anyhow, bail};
@@ -295,8 +296,15 @@ fn should_use_command_extension(background: bool, terminal_mode: &str) -> bool {
         && (terminal_mode == "default" || terminal_mode == "terminal.app")
 }
 
+/// Kitten binary location, resolved once per process.
+static KITTEN_BINARY: LazyLock<Option<String>> = LazyLock::new(detect_kitten_binary);
+
 /// Find kitten binary — PATH first, then macOS app bundle.
 fn find_kitten_binary() -> Option<String> {
+    KITTEN_BINARY.clone()
+}
+
+fn detect_kitten_binary() -> Option<String> {
     if let Some(path) = which_bin("kitten") {
         return Some(path);
     }
@@ -445,27 +453,28 @@ pub fn wezterm_reachable() -> bool {
         .unwrap_or(false)
 }
 
-/// Candidate file names to probe for `name` in a PATH directory. On Windows an
-/// extension-less name is expanded with PATHEXT (`.exe`, `.cmd`, …); elsewhere
-/// the name is used verbatim.
-pub(crate) fn which_candidates(dir: &Path, name: &str) -> Vec<std::path::PathBuf> {
+/// Candidate file names to probe for `name` in each PATH directory. On Windows
+/// an extension-less name is expanded with PATHEXT (`.exe`, `.cmd`, …);
+/// elsewhere the name is used verbatim. Callers compute this once per lookup
+/// rather than re-reading PATHEXT for every PATH entry.
+pub(crate) fn which_candidate_names(name: &str) -> Vec<String> {
     #[cfg(windows)]
     {
         if Path::new(name).extension().is_some() {
-            return vec![dir.join(name)];
+            return vec![name.to_string()];
         }
         let exts = std::env::var("PATHEXT").unwrap_or_else(|_| ".COM;.EXE;.BAT;.CMD".to_string());
-        let mut out: Vec<std::path::PathBuf> = exts
+        let mut out: Vec<String> = exts
             .split(';')
             .filter(|e| !e.is_empty())
-            .map(|ext| dir.join(format!("{name}{ext}")))
+            .map(|ext| format!("{name}{ext}"))
             .collect();
-        out.push(dir.join(name));
+        out.push(name.to_string());
         out
     }
     #[cfg(not(windows))]
     {
-        vec![dir.join(name)]
+        vec![name.to_string()]
     }
 }
 
@@ -476,8 +485,10 @@ pub fn which_bin(name: &str) -> Option<String> {
     // entirely unset (rather than merely lacking `name`) still falls through
     // to the well-known-location fallbacks below.
     if let Some(path_var) = std::env::var_os("PATH") {
+        let names = which_candidate_names(name);
         for dir in std::env::split_paths(&path_var) {
-            for candidate in which_candidates(&dir, name) {
+            for candidate_name in &names {
+                let candidate = dir.join(candidate_name);
                 if candidate.is_file() {
                     return Some(candidate.to_string_lossy().to_string());
                 }
@@ -500,7 +511,7 @@ pub fn which_bin(name: &str) -> Option<String> {
             _ => &[],
         };
         for fallback in fallbacks {
-            if fallback.exists() && fallback.is_file() {
+            if fallback.is_file() {
                 return Some(fallback.to_string_lossy().to_string());
             }
         }
@@ -1494,9 +1505,17 @@ fn windows_default_terminal_display_name(has_wt: bool) -> &'static str {
     }
 }
 
+/// Fallback terminal name, resolved once per process (up to three PATH walks).
+static DEFAULT_FALLBACK_TERMINAL_NAME: LazyLock<&'static str> =
+    LazyLock::new(detect_default_fallback_terminal_name);
+
 /// Return a human-readable name for the platform's built-in fallback terminal
 /// (used when `terminal = "default"` and no terminal is detected from env).
 pub fn get_default_fallback_terminal_name() -> &'static str {
+    *DEFAULT_FALLBACK_TERMINAL_NAME
+}
+
+fn detect_default_fallback_terminal_name() -> &'static str {
     if platform::is_termux() {
         return "Termux";
     }
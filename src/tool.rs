@@ -4,10 +4,27 @@
 //! mappings, etc.) lives in [`crate::integration_spec`]. This module just
 //! defines the enum and a thin set of forwarders.
 
+use std::collections::HashMap;
 use std::str::FromStr;
+use std::sync::LazyLock;
 
 use crate::integration_spec;
 
+/// Hook command name → routing owner, built once from the integration specs.
+/// Hook detection runs on every hcom invocation, so this replaces a scan over
+/// every spec's hook list with one hash lookup. First spec listing a name wins,
+/// matching the spec order the scan used.
+static HOOK_OWNERS: LazyLock<HashMap<&'static str, Tool>> = LazyLock::new(|| {
+    let mut owners = HashMap::new();
+    for spec in integration_spec::ALL {
+        let owner = spec.hooks.shared_hooks_with.unwrap_or(spec.tool);
+        for name in spec.hooks.names {
+            owners.entry(*name).or_insert(owner);
+        }
+    }
+    owners
+});
+
 /// Supported AI coding tools
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
 pub enum Tool {
@@ -54,10 +71,7 @@ impl Tool {
     /// Shared hook specs route to their declared owner. Antigravity, for
     /// example, lists Gemini hook names but routes them to Gemini.
     pub fn from_hook_name(name: &str) -> Option<Self> {
-        integration_spec::ALL
-            .iter()
-            .find(|spec| spec.hooks.names.contains(&name))
-            .map(|spec| spec.hooks.shared_hooks_with.unwrap_or(spec.tool))
+        HOOK_OWNERS.get(name).copied()
     }
 
     /// True if any spec with routing ownership claims this hook name.
@@ -206,15 +220,19 @@ impl FromStr for Tool {
     type Err = String;
 
     fn from_str(s: &str) -> Result<Self, Self::Err> {
-        let lower = s.to_lowercase();
+        // Spec names and aliases are lowercase ASCII, so compare in place
+        // instead of allocating a lowercased copy of the input.
         // Primary name match.
-        if let Some(spec) = integration_spec::ALL.iter().find(|s| s.name == lower) {
+        if let Some(spec) = integration_spec::ALL
+            .iter()
+            .find(|spec| spec.name.eq_ignore_ascii_case(s))
+        {
             return Ok(spec.tool);
         }
         // Alias match.
         if let Some(spec) = integration_spec::ALL
             .iter()
-            .find(|s| s.aliases.iter().any(|a| *a == lower))
+            .find(|spec| spec.aliases.iter().any(|a| a.eq_ignore_ascii_case(s)))
         {
             return Ok(spec.tool);
         }
@@ -231,7 +249,6 @@ impl std::fmt::Display for Tool {
 #[cfg(test)]
 mod tests {
     use super::*;
-    use std::collections::HashMap;
 
     #[test]
     fn adhoc_has_no_hooks() {
@@ -306,6 +323,13 @@ mod tests {
         assert_eq!("omp-agent".parse::<Tool>(), Ok(Tool::Omp));
     }
 
+    #[test]
+    fn from_str_ignores_ascii_case() {
+        assert_eq!("Claude".parse::<Tool>(), Ok(Tool::Claude));
+        assert_eq!("AGY".parse::<Tool>(), Ok(Tool::Antigravity));
+        assert!("claudex".parse::<Tool>().is_err());
+    }
+
     #[test]
     fn antigravity_shares_gemini_hooks() {
         assert_eq!(Tool::Antigravity.hooks(), Tool::Gemini.hooks());
@@ -4,6 +4,7 @@
 use crate::paths::{FLAGS_DIR, atomic_write, hcom_path};
 use std::fs;
 use std::path::{Path, PathBuf};
+use std::sync::{LazyLock, Mutex};
 use std::time::{Duration, SystemTime};
 
 const CHECK_INTERVAL: Duration = Duration::from_secs(86400); // 24 hours
@@ -15,20 +16,46 @@ pub(crate) fn flag_path() -> PathBuf {
     hcom_path(&[FLAGS_DIR, "update_check"])
 }
 
+/// Last flag contents read this process, keyed on the flag's path and mtime.
+/// `hcom status` checks for updates twice (notice + version block); the
+/// second call reuses this instead of re-reading the file. The path is part of
+/// the key because `flag_path()` follows `HCOM_DIR`, which can change in-process.
+static FLAG_CACHE: Mutex<Option<(PathBuf, SystemTime, String)>> = Mutex::new(None);
+
+/// Read the trimmed flag contents, reusing the cached value while path and mtime are unchanged.
+fn read_flag_cached(flag: &Path, mtime: Option<SystemTime>) -> Option<String> {
+    if let Some(mtime) = mtime
+        && let Ok(guard) = FLAG_CACHE.lock()
+        && let Some((ref cached_path, cached_mtime, ref latest)) = *guard
+        && cached_mtime == mtime
+        && cached_path == flag
+    {
+        return Some(latest.clone());
+    }
+
+    let latest = fs::read_to_string(flag).ok()?.trim().to_string();
+    if let Some(mtime) = mtime
+        && let Ok(mut guard) = FLAG_CACHE.lock()
+    {
+        *guard = Some((flag.to_path_buf(), mtime, latest.clone()));
+    }
+    Some(latest)
+}
+
 /// Parse version string "x.y.z" into comparable tuple.
 fn parse_version(v: &str) -> Option<(u32, u32, u32)> {
-    let parts: Vec<&str> = v.trim().trim_start_matches('v').split('.').collect();
-    if parts.len() >= 3 {
-        Some((
-            parts[0].parse().ok()?,
-            parts[1].parse().ok()?,
-            parts[2].parse().ok()?,
-        ))
-    } else {
-        None
-    }
+    let mut parts = v.trim().trim_start_matches('v').split('.');
+    Some((
+        parts.next()?.parse().ok()?,
+        parts.next()?.parse().ok()?,
+        parts.next()?.parse().ok()?,
+    ))
 }
 
+/// Parsed `CARGO_PKG_VERSION`, computed once per process.
+static CURRENT_VERSION: LazyLock<Option<(u32, u32, u32)>> =
+    LazyLock::new(|| parse_version(env!("CARGO_PKG_VERSION")));
+
 /// Spawn a detached background process to fetch latest version and write the cache file.
 /// Returns immediately — result shows up on next command.
 ///
@@ -157,9 +184,7 @@ pub fn fetch_update_info() -> anyhow::Result<UpdateInfo> {
     let latest =
         fetch_latest_version().ok_or_else(|| anyhow::anyhow!("Could not reach GitHub API"))?;
 
-    let current_parsed = parse_version(&current);
-    let latest_parsed = parse_version(&latest);
-    let available = current_parsed < latest_parsed;
+    let available = *CURRENT_VERSION < parse_version(&latest);
     let cmd = get_update_cmd();
 
     Ok(UpdateInfo {
@@ -211,13 +236,15 @@ pub(crate) fn split_program_args(cmd: &str) -> Option<(&str, Vec<&str>)> {
     Some((program, parts.collect()))
 }
 
+/// Install method for this process; the exe path never changes at runtime.
+static UPDATE_CMD: LazyLock<&'static str> = LazyLock::new(|| match std::env::current_exe() {
+    Ok(exe) => get_update_cmd_for_exe(&exe),
+    Err(_) => platform_installer_cmd(),
+});
+
 /// Detect install method and return appropriate update command.
 fn get_update_cmd() -> &'static str {
-    let exe = match std::env::current_exe() {
-        Ok(p) => p,
-        Err(_) => return platform_installer_cmd(),
-    };
-    get_update_cmd_for_exe(&exe)
+    *UPDATE_CMD
 }
 
 fn get_update_cmd_for_exe(exe: &Path) -> &'static str {
@@ -343,19 +370,16 @@ pub fn get_update_info() -> Option<(String, &'static str)> {
     let flag = flag_path();
     let current = env!("CARGO_PKG_VERSION");
 
-    // Check if cache is stale and needs refresh
-    let should_check = if flag.exists() {
-        match flag.metadata().and_then(|m| m.modified()) {
-            Ok(mtime) => {
-                SystemTime::now()
-                    .duration_since(mtime)
-                    .unwrap_or(Duration::ZERO)
-                    > CHECK_INTERVAL
-            }
-            Err(_) => true,
+    // Check if cache is stale and needs refresh (single stat; missing flag → stale)
+    let mtime = fs::metadata(&flag).and_then(|m| m.modified()).ok();
+    let should_check = match mtime {
+        Some(mtime) => {
+            SystemTime::now()
+                .duration_since(mtime)
+                .unwrap_or(Duration::ZERO)
+                > CHECK_INTERVAL
         }
-    } else {
-        true
+        None => true,
     };
 
     if should_check {
@@ -364,13 +388,13 @@ pub fn get_update_info() -> Option<(String, &'static str)> {
     }
 
     // Read cached result (may be from a previous check)
-    let latest = fs::read_to_string(&flag).ok()?.trim().to_string();
+    let latest = read_flag_cached(&flag, mtime)?;
     if latest.is_empty() {
         return None;
     }
 
     // Double-check (handles manual upgrades)
-    if parse_version(current) >= parse_version(&latest) {
+    if *CURRENT_VERSION >= parse_version(&latest) {
         atomic_write(&flag, "");
         return None;
     }
@@ -394,6 +418,35 @@ mod tests {
         assert_eq!(parse_version("v1.2.3"), Some((1, 2, 3)));
         assert_eq!(parse_version("bad"), None);
         assert_eq!(parse_version("1.2"), None);
+        assert_eq!(parse_version("1.2.3.4"), Some((1, 2, 3)));
+    }
+
+    #[test]
+    fn test_read_flag_cached_reuses_value_for_same_mtime() {
+        let tmp = tempfile::tempdir().unwrap();
+        let flag = tmp.path().join("update_check");
+        std::fs::write(&flag, "9.9.9\n").unwrap();
+        let mtime = std::fs::metadata(&flag).unwrap().modified().unwrap();
+        assert_eq!(
+            read_flag_cached(&flag, Some(mtime)).as_deref(),
+            Some("9.9.9")
+        );
+
+        // Same mtime: served from cache without touching the file
+        std::fs::remove_file(&flag).unwrap();
+        assert_eq!(
+            read_flag_cached(&flag, Some(mtime)).as_deref(),
+            Some("9.9.9")
+        );
+        assert_eq!(read_flag_cached(&flag, None), None);
+
+        // Different flag file with the same mtime must not hit the cache
+        let other = tmp.path().join("other_update_check");
+        std::fs::write(&other, "1.0.0\n").unwrap();
+        assert_eq!(
+            read_flag_cached(&other, Some(mtime)).as_deref(),
+            Some("1.0.0")
+        );
     }
 
     #[test]